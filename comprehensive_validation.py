@@ -4,13 +4,30 @@ Comprehensive Homelab Infrastructure Validation Script
 Validates all services are operational, SSO authentication, service integration, and monitoring.
 """
 
+import asyncio
 import json
 import ssl
-import subprocess
 import sys
-import urllib.request
+from collections import defaultdict
 from typing import Any
 
+import httpx
+
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+
+# Resource kinds returned by HomelabValidator.fetch_all_resources, in kubectl order
+RESOURCE_KINDS = ("Node", "Pod", "Ingress", "Certificate")
+
+# Namespaces excluded from service validation
+SYSTEM_NAMESPACES = frozenset({"kube-system", "metallb-system", "ingress-nginx", "cert-manager"})
+
 
 class HomelabValidator:
     def __init__(self) -> None:
@@ -22,193 +39,235 @@ class HomelabValidator:
             "monitoring_validation": {},
             "overall_status": "unknown",
         }
+        # Build the TLS context once; self-signed certificates are expected
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        self._ssl_ctx = ssl_context
+
+        # One pooled client for every HTTPS probe
+        self.http_client = httpx.AsyncClient(
+            verify=self._ssl_ctx,
+            timeout=10,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=16),
+        )
+
+    async def run_command_async(self, cmd: list[str]) -> dict[str, Any]:
+        """Execute a command without blocking the event loop and return result.
 
-    def run_command(self, cmd: list[str]) -> dict[str, Any]:
-        """Execute a shell command and return result."""
+        stdout is returned as raw bytes for the JSON parser; only stderr is decoded.
+        """
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, check=False)
-            return {
-                "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "returncode": result.returncode,
-            }
-        except subprocess.TimeoutExpired:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except Exception as e:
             return {
                 "success": False,
-                "stdout": "",
-                "stderr": "Command timed out",
+                "stdout": b"",
+                "stderr": str(e),
                 "returncode": -1,
             }
-        except Exception as e:
+
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
             return {
                 "success": False,
-                "stdout": "",
-                "stderr": str(e),
+                "stdout": b"",
+                "stderr": "Command timed out",
                 "returncode": -1,
             }
 
-    def validate_cluster_health(self) -> None:
+        return {
+            "success": proc.returncode == 0,
+            "stdout": stdout,
+            "stderr": stderr.decode(errors="replace"),
+            "returncode": proc.returncode,
+        }
+
+    async def fetch_all_resources(
+        self,
+    ) -> tuple[dict[str, Any], dict[str, list[dict[str, Any]] | None]]:
+        """Fetch nodes, pods, ingresses and certificates with a single kubectl call.
+
+        This is the only kubectl invocation per run, so kubeconfig loading and
+        auth plugins execute once; its outcome doubles as the cluster access check.
+
+        Returns the cluster info and the list items grouped by kind. A kind maps
+        to None when it could not be fetched, and to an empty list when kubectl
+        output was unparseable.
+        """
+        resources: dict[str, list[dict[str, Any]] | None] = dict.fromkeys(RESOURCE_KINDS)
+
+        result = await self.run_command_async(
+            ["kubectl", "get", "nodes,pods,ingresses,certificates", "-A", "-o", "json"],
+        )
+        if not result["success"] and "certificates" in result["stderr"]:
+            # cert-manager CRDs are not installed; fetch the core resources only
+            result = await self.run_command_async(
+                ["kubectl", "get", "nodes,pods,ingresses", "-A", "-o", "json"],
+            )
+            fetched_kinds = RESOURCE_KINDS[:-1]
+        else:
+            fetched_kinds = RESOURCE_KINDS
+
+        if not result["success"]:
+            return {"accessible": False, "details": result["stderr"]}, resources
+
+        for kind in fetched_kinds:
+            resources[kind] = []
+
+        try:
+            data = json_loads(result["stdout"])
+        except json.JSONDecodeError:
+            return {"accessible": True, "details": "Unparseable kubectl output"}, resources
+
+        items = data.get("items", [])
+        for item in items:
+            bucket = resources.get(item.get("kind"))
+            if bucket is not None:
+                bucket.append(item)
+
+        cluster_info = {
+            "accessible": True,
+            "details": f"Listed {len(items)} resources from the API server",
+        }
+        return cluster_info, resources
+
+    def validate_cluster_health(
+        self,
+        cluster_info: dict[str, Any],
+        node_items: list[dict[str, Any]] | None,
+        pod_items: list[dict[str, Any]] | None,
+    ) -> None:
         """Validate Kubernetes cluster health."""
         print("🏥 Validating Cluster Health...")
 
         # Check cluster info
-        result = self.run_command(["kubectl", "cluster-info"])
-        self.results["cluster_health"]["cluster_info"] = {
-            "accessible": result["success"],
-            "details": result["stdout"] if result["success"] else result["stderr"],
-        }
+        self.results["cluster_health"]["cluster_info"] = cluster_info
 
         # Check node status
-        result = self.run_command(["kubectl", "get", "nodes", "-o", "json"])
-        if result["success"]:
-            try:
-                nodes_data = json.loads(result["stdout"])
-                nodes = []
-                for node in nodes_data.get("items", []):
-                    node_name = node["metadata"]["name"]
-                    conditions = node["status"]["conditions"]
-                    ready_condition = next((c for c in conditions if c["type"] == "Ready"), None)
-                    nodes.append(
-                        {
-                            "name": node_name,
-                            "ready": ready_condition["status"] == "True"
-                            if ready_condition
-                            else False,
-                            "status": "Ready"
-                            if ready_condition and ready_condition["status"] == "True"
-                            else "NotReady",
-                        },
-                    )
-                self.results["cluster_health"]["nodes"] = nodes
-            except json.JSONDecodeError:
-                self.results["cluster_health"]["nodes"] = []
+        if node_items is not None:
+            nodes = []
+            for node in node_items:
+                node_name = node["metadata"]["name"]
+                cond_by_type = {c["type"]: c for c in node["status"]["conditions"]}
+                ready = cond_by_type.get("Ready", {}).get("status") == "True"
+                nodes.append(
+                    {
+                        "name": node_name,
+                        "ready": ready,
+                        "status": "Ready" if ready else "NotReady",
+                    },
+                )
+            self.results["cluster_health"]["nodes"] = nodes
 
         # Check system pods
-        result = self.run_command(["kubectl", "get", "pods", "-n", "kube-system", "-o", "json"])
-        if result["success"]:
-            try:
-                pods_data = json.loads(result["stdout"])
-                system_pods = []
-                for pod in pods_data.get("items", []):
-                    pod_name = pod["metadata"]["name"]
-                    phase = pod["status"]["phase"]
-                    system_pods.append(
-                        {
-                            "name": pod_name,
-                            "phase": phase,
-                            "ready": phase == "Running",
-                        },
-                    )
-                self.results["cluster_health"]["system_pods"] = system_pods
-            except json.JSONDecodeError:
-                self.results["cluster_health"]["system_pods"] = []
-
-    def validate_service_status(self) -> None:
+        if pod_items is not None:
+            system_pods = []
+            for pod in pod_items:
+                if pod["metadata"]["namespace"] != "kube-system":
+                    continue
+                pod_name = pod["metadata"]["name"]
+                phase = pod["status"]["phase"]
+                system_pods.append(
+                    {
+                        "name": pod_name,
+                        "phase": phase,
+                        "ready": phase == "Running",
+                    },
+                )
+            self.results["cluster_health"]["system_pods"] = system_pods
+
+    def validate_service_status(self, pod_items: list[dict[str, Any]] | None) -> None:
         """Validate all deployed services."""
         print("🚀 Validating Service Status...")
 
-        # Get all pods across namespaces
-        result = self.run_command(["kubectl", "get", "pods", "-A", "-o", "json"])
-        if result["success"]:
-            try:
-                pods_data = json.loads(result["stdout"])
-                services = {}
-
-                for pod in pods_data.get("items", []):
-                    namespace = pod["metadata"]["namespace"]
-                    pod_name = pod["metadata"]["name"]
-                    phase = pod["status"]["phase"]
-
-                    # Skip system namespaces for service validation
-                    if namespace in [
-                        "kube-system",
-                        "metallb-system",
-                        "ingress-nginx",
-                        "cert-manager",
-                    ]:
-                        continue
-
-                    if namespace not in services:
-                        services[namespace] = []
-
-                    # Check if pod is ready
-                    ready = False
-                    if "containerStatuses" in pod["status"]:
-                        ready = all(
-                            c.get("ready", False) for c in pod["status"]["containerStatuses"]
-                        )
-
-                    services[namespace].append(
-                        {
-                            "pod_name": pod_name,
-                            "phase": phase,
-                            "ready": ready,
-                            "running": phase == "Running" and ready,
-                        },
-                    )
-
-                self.results["service_status"] = services
-            except json.JSONDecodeError:
-                self.results["service_status"] = {}
-
-    def validate_ingress_and_certificates(self) -> None:
+        if pod_items is None:
+            return
+
+        services: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+
+        for pod in pod_items:
+            metadata = pod["metadata"]
+            namespace = metadata["namespace"]
+
+            # Skip system namespaces for service validation
+            if namespace in SYSTEM_NAMESPACES:
+                continue
+
+            status = pod["status"]
+            phase = status["phase"]
+
+            # A pod without containerStatuses is not ready; otherwise every container must be
+            container_statuses = status.get("containerStatuses")
+            ready = container_statuses is not None and all(
+                c.get("ready", False) for c in container_statuses
+            )
+
+            services[namespace].append(
+                {
+                    "pod_name": metadata["name"],
+                    "phase": phase,
+                    "ready": ready,
+                    "running": ready and phase == "Running",
+                },
+            )
+
+        self.results["service_status"] = dict(services)
+
+    def validate_ingress_and_certificates(
+        self,
+        ingress_items: list[dict[str, Any]] | None,
+        cert_items: list[dict[str, Any]] | None,
+    ) -> None:
         """Validate ingress and certificate status."""
         print("🔐 Validating Ingress and Certificates...")
 
         # Check ingresses
-        result = self.run_command(["kubectl", "get", "ingress", "-A", "-o", "json"])
-        if result["success"]:
-            try:
-                ingress_data = json.loads(result["stdout"])
-                ingresses = []
-                for ingress in ingress_data.get("items", []):
-                    name = ingress["metadata"]["name"]
-                    namespace = ingress["metadata"]["namespace"]
-                    hosts = []
-                    if "rules" in ingress["spec"]:
-                        hosts = [rule.get("host", "unknown") for rule in ingress["spec"]["rules"]]
-
-                    ingresses.append(
-                        {
-                            "name": name,
-                            "namespace": namespace,
-                            "hosts": hosts,
-                        },
-                    )
-                self.results["service_integration"]["ingresses"] = ingresses
-            except json.JSONDecodeError:
-                self.results["service_integration"]["ingresses"] = []
+        if ingress_items is not None:
+            ingresses = []
+            for ingress in ingress_items:
+                name = ingress["metadata"]["name"]
+                namespace = ingress["metadata"]["namespace"]
+                hosts = []
+                if "rules" in ingress["spec"]:
+                    hosts = [rule.get("host", "unknown") for rule in ingress["spec"]["rules"]]
+
+                ingresses.append(
+                    {
+                        "name": name,
+                        "namespace": namespace,
+                        "hosts": hosts,
+                    },
+                )
+            self.results["service_integration"]["ingresses"] = ingresses
 
         # Check certificates
-        result = self.run_command(["kubectl", "get", "certificates", "-A", "-o", "json"])
-        if result["success"]:
-            try:
-                cert_data = json.loads(result["stdout"])
-                certificates = []
-                for cert in cert_data.get("items", []):
-                    name = cert["metadata"]["name"]
-                    namespace = cert["metadata"]["namespace"]
-                    ready = False
-                    if "status" in cert and "conditions" in cert["status"]:
-                        ready_condition = next(
-                            (c for c in cert["status"]["conditions"] if c["type"] == "Ready"),
-                            None,
-                        )
-                        ready = ready_condition["status"] == "True" if ready_condition else False
-
-                    certificates.append(
-                        {
-                            "name": name,
-                            "namespace": namespace,
-                            "ready": ready,
-                        },
-                    )
-                self.results["service_integration"]["certificates"] = certificates
-            except json.JSONDecodeError:
-                self.results["service_integration"]["certificates"] = []
-
-    def validate_sso_authentication(self) -> None:
+        if cert_items is not None:
+            certificates = []
+            for cert in cert_items:
+                name = cert["metadata"]["name"]
+                namespace = cert["metadata"]["namespace"]
+                cond_by_type = {c["type"]: c for c in cert.get("status", {}).get("conditions", [])}
+                ready = cond_by_type.get("Ready", {}).get("status") == "True"
+
+                certificates.append(
+                    {
+                        "name": name,
+                        "namespace": namespace,
+                        "ready": ready,
+                    },
+                )
+            self.results["service_integration"]["certificates"] = certificates
+
+    async def validate_sso_authentication(self) -> None:
         """Validate SSO authentication and OAuth2 proxy."""
         print("🔐 Validating SSO Authentication...")
 
@@ -219,110 +278,79 @@ class HomelabValidator:
             "auth.homelab.local",
         ]
 
-        auth_results = {}
+        responses = await asyncio.gather(
+            *(self.http_client.get(f"https://{service}") for service in services_to_test),
+            return_exceptions=True,
+        )
 
-        for service in services_to_test:
-            try:
-                # Create SSL context that accepts self-signed certificates
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-
-                # Test HTTPS connectivity
-                url = f"https://{service}"
-                req = urllib.request.Request(url)
-
-                try:
-                    with urllib.request.urlopen(req, context=ssl_context, timeout=10) as response:
-                        status_code = response.getcode()
-                        auth_results[service] = {
-                            "accessible": True,
-                            "https_enabled": True,
-                            "status_code": status_code,
-                            "redirect_detected": status_code in [301, 302, 307, 308],
-                        }
-                except urllib.error.HTTPError as e:
-                    auth_results[service] = {
-                        "accessible": True,
-                        "https_enabled": True,
-                        "status_code": e.code,
-                        "redirect_detected": e.code in [301, 302, 307, 308],
-                    }
+        auth_results = {}
 
-            except Exception as e:
+        for service, response in zip(services_to_test, responses, strict=True):
+            if isinstance(response, BaseException):
                 auth_results[service] = {
                     "accessible": False,
                     "https_enabled": False,
-                    "error": str(e),
+                    "error": str(response),
                 }
+                continue
+
+            status_code = response.status_code
+            auth_results[service] = {
+                "accessible": True,
+                "https_enabled": True,
+                "status_code": status_code,
+                "redirect_detected": status_code in [301, 302, 307, 308],
+            }
 
         self.results["sso_authentication"] = auth_results
 
-    def validate_monitoring_dashboards(self) -> None:
+    async def validate_monitoring_dashboards(self) -> None:
         """Validate monitoring dashboards and metrics collection."""
         print("📊 Validating Monitoring Dashboards...")
 
         monitoring_results = {}
 
-        # Test Prometheus metrics endpoint
-        try:
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-
-            # Test Prometheus API
-            prom_url = "https://prometheus.homelab.local/api/v1/targets"
-            req = urllib.request.Request(prom_url)
+        # Test Prometheus API and Grafana accessibility together
+        prom_response, grafana_response = await asyncio.gather(
+            self.http_client.get("https://prometheus.homelab.local/api/v1/targets"),
+            self.http_client.get("https://grafana.homelab.local"),
+            return_exceptions=True,
+        )
 
+        if isinstance(prom_response, BaseException):
+            monitoring_results["prometheus"] = {
+                "accessible": False,
+                "error": str(prom_response),
+            }
+        elif prom_response.status_code == 200:
             try:
-                with urllib.request.urlopen(req, context=ssl_context, timeout=10) as response:
-                    if response.getcode() == 200:
-                        data = json.loads(response.read().decode())
-                        active_targets = data.get("data", {}).get("activeTargets", [])
-                        monitoring_results["prometheus"] = {
-                            "accessible": True,
-                            "targets_count": len(active_targets),
-                            "targets_up": len(
-                                [t for t in active_targets if t.get("health") == "up"],
-                            ),
-                        }
-                    else:
-                        monitoring_results["prometheus"] = {
-                            "accessible": False,
-                            "error": f"HTTP {response.getcode()}",
-                        }
+                data = json_loads(prom_response.content)
+                active_targets = data.get("data", {}).get("activeTargets", [])
+                monitoring_results["prometheus"] = {
+                    "accessible": True,
+                    "targets_count": len(active_targets),
+                    "targets_up": sum(1 for t in active_targets if t.get("health") == "up"),
+                }
             except Exception as e:
                 monitoring_results["prometheus"] = {
                     "accessible": False,
                     "error": str(e),
                 }
-
-        except Exception as e:
+        else:
             monitoring_results["prometheus"] = {
                 "accessible": False,
-                "error": str(e),
+                "error": f"HTTP {prom_response.status_code}",
             }
 
-        # Test Grafana accessibility
-        try:
-            grafana_url = "https://grafana.homelab.local"
-            req = urllib.request.Request(grafana_url)
-
-            try:
-                with urllib.request.urlopen(req, context=ssl_context, timeout=10) as response:
-                    monitoring_results["grafana"] = {
-                        "accessible": True,
-                        "status_code": response.getcode(),
-                    }
-            except urllib.error.HTTPError as e:
-                monitoring_results["grafana"] = {
-                    "accessible": True,
-                    "status_code": e.code,
-                }
-        except Exception as e:
+        if isinstance(grafana_response, BaseException):
             monitoring_results["grafana"] = {
                 "accessible": False,
-                "error": str(e),
+                "error": str(grafana_response),
+            }
+        else:
+            monitoring_results["grafana"] = {
+                "accessible": True,
+                "status_code": grafana_response.status_code,
             }
 
         self.results["monitoring_validation"] = monitoring_results
@@ -331,147 +359,175 @@ class HomelabValidator:
         """Determine overall system status."""
         print("🎯 Determining Overall Status...")
 
+        results = self.results
+        cluster_health = results["cluster_health"]
+        service_status = results["service_status"]
+        sso_results = results["sso_authentication"]
+        integration = results["service_integration"]
+        monitoring = results["monitoring_validation"]
+
         issues = []
         warnings = []
 
         # Check cluster health
-        if not self.results["cluster_health"].get("cluster_info", {}).get("accessible", False):
+        if not cluster_health.get("cluster_info", {}).get("accessible", False):
             issues.append("Cluster not accessible")
 
         # Check nodes
-        nodes = self.results["cluster_health"].get("nodes", [])
-        unhealthy_nodes = [n for n in nodes if not n.get("ready", False)]
+        nodes = cluster_health.get("nodes", [])
+        unhealthy_nodes = sum(1 for n in nodes if not n.get("ready", False))
         if unhealthy_nodes:
-            issues.append(f"{len(unhealthy_nodes)} unhealthy nodes")
+            issues.append(f"{unhealthy_nodes} unhealthy nodes")
 
         # Check system pods
-        system_pods = self.results["cluster_health"].get("system_pods", [])
-        failed_system_pods = [p for p in system_pods if not p.get("ready", False)]
+        system_pods = cluster_health.get("system_pods", [])
+        failed_system_pods = sum(1 for p in system_pods if not p.get("ready", False))
         if failed_system_pods:
-            warnings.append(f"{len(failed_system_pods)} system pods not ready")
+            warnings.append(f"{failed_system_pods} system pods not ready")
 
         # Check services
-        for namespace, pods in self.results["service_status"].items():
-            failed_pods = [p for p in pods if not p.get("running", False)]
+        for namespace, pods in service_status.items():
+            failed_pods = sum(1 for p in pods if not p.get("running", False))
             if failed_pods:
-                issues.append(f"{len(failed_pods)} failed pods in {namespace}")
+                issues.append(f"{failed_pods} failed pods in {namespace}")
 
         # Check certificates
-        certificates = self.results["service_integration"].get("certificates", [])
-        unready_certs = [c for c in certificates if not c.get("ready", False)]
+        certificates = integration.get("certificates", [])
+        unready_certs = sum(1 for c in certificates if not c.get("ready", False))
         if unready_certs:
-            warnings.append(f"{len(unready_certs)} certificates not ready")
+            warnings.append(f"{unready_certs} certificates not ready")
 
         # Check SSO authentication
         auth_failures = [
             service
-            for service, result in self.results["sso_authentication"].items()
+            for service, result in sso_results.items()
             if not result.get("accessible", False)
         ]
         if auth_failures:
             issues.append(f"SSO authentication failures: {', '.join(auth_failures)}")
 
         # Check monitoring
-        if not self.results["monitoring_validation"].get("prometheus", {}).get("accessible", False):
+        if not monitoring.get("prometheus", {}).get("accessible", False):
             issues.append("Prometheus not accessible")
-        if not self.results["monitoring_validation"].get("grafana", {}).get("accessible", False):
+        if not monitoring.get("grafana", {}).get("accessible", False):
             issues.append("Grafana not accessible")
 
         # Determine overall status
         if issues:
-            self.results["overall_status"] = "FAIL"
-            self.results["issues"] = issues
+            results["overall_status"] = "FAIL"
+            results["issues"] = issues
         elif warnings:
-            self.results["overall_status"] = "WARNING"
-            self.results["warnings"] = warnings
+            results["overall_status"] = "WARNING"
+            results["warnings"] = warnings
         else:
-            self.results["overall_status"] = "PASS"
+            results["overall_status"] = "PASS"
 
-        self.results["issues"] = issues
-        self.results["warnings"] = warnings
+        results["issues"] = issues
+        results["warnings"] = warnings
 
     def print_summary(self) -> int:
         """Print comprehensive validation summary."""
-        print("\n" + "=" * 80)
-        print("🏠 COMPREHENSIVE HOMELAB INFRASTRUCTURE VALIDATION REPORT")
-        print("=" * 80)
+        # Collect the report and write it in one call instead of a print per line
+        lines: list[str] = []
+        emit = lines.append
+
+        results = self.results
+        cluster_health = results["cluster_health"]
+        service_status = results["service_status"]
+        sso_results = results["sso_authentication"]
+        integration = results["service_integration"]
+        monitoring = results["monitoring_validation"]
+
+        emit("\n" + "=" * 80)
+        emit("🏠 COMPREHENSIVE HOMELAB INFRASTRUCTURE VALIDATION REPORT")
+        emit("=" * 80)
 
-        print(f"\n🎯 OVERALL STATUS: {self.results['overall_status']}")
+        emit(f"\n🎯 OVERALL STATUS: {results['overall_status']}")
 
-        if self.results.get("issues"):
-            print(f"\n🚨 CRITICAL ISSUES ({len(self.results['issues'])}):")
-            for issue in self.results["issues"]:
-                print(f"  ❌ {issue}")
+        if results.get("issues"):
+            emit(f"\n🚨 CRITICAL ISSUES ({len(results['issues'])}):")
+            for issue in results["issues"]:
+                emit(f"  ❌ {issue}")
 
-        if self.results.get("warnings"):
-            print(f"\n⚠️  WARNINGS ({len(self.results['warnings'])}):")
-            for warning in self.results["warnings"]:
-                print(f"  ⚠️  {warning}")
+        if results.get("warnings"):
+            emit(f"\n⚠️  WARNINGS ({len(results['warnings'])}):")
+            for warning in results["warnings"]:
+                emit(f"  ⚠️  {warning}")
 
         # Cluster Health Summary
-        print("\n🏥 CLUSTER HEALTH:")
-        cluster_accessible = (
-            self.results["cluster_health"].get("cluster_info", {}).get("accessible", False)
-        )
-        print(f"  Cluster Accessible: {'✅' if cluster_accessible else '❌'}")
+        emit("\n🏥 CLUSTER HEALTH:")
+        cluster_accessible = cluster_health.get("cluster_info", {}).get("accessible", False)
+        emit(f"  Cluster Accessible: {'✅' if cluster_accessible else '❌'}")
 
-        nodes = self.results["cluster_health"].get("nodes", [])
-        healthy_nodes = len([n for n in nodes if n.get("ready", False)])
-        print(f"  Healthy Nodes: {healthy_nodes}/{len(nodes)}")
+        nodes = cluster_health.get("nodes", [])
+        healthy_nodes = sum(1 for n in nodes if n.get("ready", False))
+        emit(f"  Healthy Nodes: {healthy_nodes}/{len(nodes)}")
 
-        system_pods = self.results["cluster_health"].get("system_pods", [])
-        ready_system_pods = len([p for p in system_pods if p.get("ready", False)])
-        print(f"  Ready System Pods: {ready_system_pods}/{len(system_pods)}")
+        system_pods = cluster_health.get("system_pods", [])
+        ready_system_pods = sum(1 for p in system_pods if p.get("ready", False))
+        emit(f"  Ready System Pods: {ready_system_pods}/{len(system_pods)}")
 
         # Service Status Summary
-        print("\n🚀 SERVICE STATUS:")
-        for namespace, pods in self.results["service_status"].items():
-            running_pods = len([p for p in pods if p.get("running", False)])
+        emit("\n🚀 SERVICE STATUS:")
+        for namespace, pods in service_status.items():
+            running_pods = sum(1 for p in pods if p.get("running", False))
             total_pods = len(pods)
             status_icon = "✅" if running_pods == total_pods else "❌"
-            print(f"  {status_icon} {namespace}: {running_pods}/{total_pods} pods running")
+            emit(f"  {status_icon} {namespace}: {running_pods}/{total_pods} pods running")
 
         # SSO Authentication Summary
-        print("\n🔐 SSO AUTHENTICATION:")
-        for service, result in self.results["sso_authentication"].items():
+        emit("\n🔐 SSO AUTHENTICATION:")
+        for service, result in sso_results.items():
             accessible = result.get("accessible", False)
             https_enabled = result.get("https_enabled", False)
             icon = "✅" if accessible and https_enabled else "❌"
-            print(f"  {icon} {service}: HTTPS {'✅' if https_enabled else '❌'}")
+            emit(f"  {icon} {service}: HTTPS {'✅' if https_enabled else '❌'}")
 
         # Service Integration Summary
-        print("\n🔗 SERVICE INTEGRATION:")
-        ingresses = self.results["service_integration"].get("ingresses", [])
-        print(f"  Ingresses Configured: {len(ingresses)}")
+        emit("\n🔗 SERVICE INTEGRATION:")
+        ingresses = integration.get("ingresses", [])
+        emit(f"  Ingresses Configured: {len(ingresses)}")
 
-        certificates = self.results["service_integration"].get("certificates", [])
-        ready_certs = len([c for c in certificates if c.get("ready", False)])
-        print(f"  Ready Certificates: {ready_certs}/{len(certificates)}")
+        certificates = integration.get("certificates", [])
+        ready_certs = sum(1 for c in certificates if c.get("ready", False))
+        emit(f"  Ready Certificates: {ready_certs}/{len(certificates)}")
 
         # Monitoring Summary
-        print("\n📊 MONITORING VALIDATION:")
-        prom_accessible = (
-            self.results["monitoring_validation"].get("prometheus", {}).get("accessible", False)
-        )
-        print(f"  Prometheus: {'✅' if prom_accessible else '❌'}")
+        emit("\n📊 MONITORING VALIDATION:")
+        prom_accessible = monitoring.get("prometheus", {}).get("accessible", False)
+        emit(f"  Prometheus: {'✅' if prom_accessible else '❌'}")
 
         if prom_accessible:
-            targets_up = self.results["monitoring_validation"]["prometheus"].get("targets_up", 0)
-            targets_total = self.results["monitoring_validation"]["prometheus"].get(
-                "targets_count",
-                0,
-            )
-            print(f"    Active Targets: {targets_up}/{targets_total}")
+            targets_up = monitoring["prometheus"].get("targets_up", 0)
+            targets_total = monitoring["prometheus"].get("targets_count", 0)
+            emit(f"    Active Targets: {targets_up}/{targets_total}")
 
-        grafana_accessible = (
-            self.results["monitoring_validation"].get("grafana", {}).get("accessible", False)
-        )
-        print(f"  Grafana: {'✅' if grafana_accessible else '❌'}")
+        grafana_accessible = monitoring.get("grafana", {}).get("accessible", False)
+        emit(f"  Grafana: {'✅' if grafana_accessible else '❌'}")
 
-        print(f"\n{'=' * 80}")
+        emit(f"\n{'=' * 80}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
         # Return appropriate exit code
-        return 0 if self.results["overall_status"] in ["PASS", "WARNING"] else 1
+        return 0 if results["overall_status"] in ["PASS", "WARNING"] else 1
+
+    async def _run_all(self) -> None:
+        """Run the kubectl fetch and the HTTPS probes concurrently, then validate.
+
+        Each stage writes its own top-level key of self.results, so they can
+        overlap without coordination.
+        """
+        try:
+            (cluster_info, resources), _, _ = await asyncio.gather(
+                self.fetch_all_resources(),
+                self.validate_sso_authentication(),
+                self.validate_monitoring_dashboards(),
+            )
+            self.validate_cluster_health(cluster_info, resources["Node"], resources["Pod"])
+            self.validate_service_status(resources["Pod"])
+            self.validate_ingress_and_certificates(resources["Ingress"], resources["Certificate"])
+        finally:
+            await self.http_client.aclose()
 
     def run_comprehensive_validation(self):
         """Run complete validation suite."""
@@ -479,11 +535,7 @@ class HomelabValidator:
         print("=" * 80)
 
         try:
-            self.validate_cluster_health()
-            self.validate_service_status()
-            self.validate_ingress_and_certificates()
-            self.validate_sso_authentication()
-            self.validate_monitoring_dashboards()
+            asyncio.run(self._run_all())
             self.determine_overall_status()
         except Exception as e:
             print(f"❌ Validation failed with error: {e}")
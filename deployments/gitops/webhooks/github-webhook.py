@@ -2,16 +2,28 @@
 """
 GitHub Webhook Integration for GitOps Automated Deployments
 Triggers ArgoCD sync when repository changes are detected.
+
+Serve with a production WSGI server rather than Flask's development server, e.g.:
+    gunicorn -w 1 -k gthread --threads 32 -b 0.0.0.0:8080 github-webhook:app
 """
 
+import functools
 import hashlib
 import hmac
 import logging
 import os
-import subprocess
-from datetime import datetime
-
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import orjson
+import requests
 from flask import Flask, abort, jsonify, request
+from flask.json.provider import JSONProvider
+from requests.adapters import HTTPAdapter
 
 from kubernetes import client, config
 
@@ -23,85 +35,192 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider that parses payloads and renders responses with orjson."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype="application/json")
+
+
+class HMACInputStream:
+    """Read-through wrapper for ``wsgi.input`` that feeds every byte read into an HMAC."""
+
+    def __init__(self, stream, mac):
+        self._stream = stream
+        self._mac = mac
+
+    def read(self, *args):
+        data = self._stream.read(*args)
+        self._mac.update(data)
+        return data
+
+    def readline(self, *args):
+        line = self._stream.readline(*args)
+        self._mac.update(line)
+        return line
+
+    def readlines(self, *args):
+        lines = self._stream.readlines(*args)
+        for line in lines:
+            self._mac.update(line)
+        return lines
+
+    def __iter__(self):
+        for chunk in self._stream:
+            self._mac.update(chunk)
+            yield chunk
+
+
+class HMACInputMiddleware:
+    """Hash GitHub webhook bodies while Flask reads them, so the payload is walked once.
+
+    The running MAC is exposed as ``environ["homelab.hmac"]``; its digest is only
+    complete once the body has been fully read (e.g. via ``request.get_data()``).
+    """
+
+    def __init__(self, wsgi_app, paths):
+        self.wsgi_app = wsgi_app
+        self.paths = frozenset(paths)
+
+    def __call__(self, environ, start_response):
+        if environ.get("PATH_INFO") in self.paths:
+            mac = _HMAC_TEMPLATE.copy()
+            environ["wsgi.input"] = HMACInputStream(environ["wsgi.input"], mac)
+            environ["homelab.hmac"] = mac
+        return self.wsgi_app(environ, start_response)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+
+# HMAC-SHA256 only takes OpenSSL's accelerated path when hashlib is OpenSSL-backed
+if hashlib.sha256.__module__ != "_hashlib":
+    logger.warning("hashlib is not backed by OpenSSL; webhook signature checks will be slower")
 
 # Configuration
 WEBHOOK_SECRET = os.environ.get("WEBHOOK_SECRET", "your-github-webhook-secret")
+# Keyed once at startup; verify_signature copies it instead of re-keying per request
+_HMAC_TEMPLATE = hmac.new(WEBHOOK_SECRET.encode("utf-8"), digestmod="sha256")
 ARGOCD_SERVER = os.environ.get("ARGOCD_SERVER", "argocd-server.argocd.svc.cluster.local:443")
 ARGOCD_TOKEN = os.environ.get("ARGOCD_TOKEN", "")
 NAMESPACE = os.environ.get("NAMESPACE", "argocd")
-
-# Load Kubernetes config
-try:
-    config.load_incluster_config()
-    logger.info("Loaded in-cluster Kubernetes configuration")
-except config.ConfigException:
-    config.load_kube_config()
-    logger.info("Loaded local Kubernetes configuration")
-
-k8s_client = client.ApiClient()
+DEPLOY_BRANCHES = frozenset(
+    branch.strip()
+    for branch in os.environ.get("DEPLOY_BRANCHES", "main,master,develop").split(",")
+    if branch.strip()
+)
 
 
-def verify_signature(payload_body, signature_header):
-    """Verify GitHub webhook signature."""
+@functools.cache
+def get_k8s_client():
+    """Load Kubernetes config and build the API client on first use only."""
+    try:
+        config.load_incluster_config()
+        logger.info("Loaded in-cluster Kubernetes configuration")
+    except config.ConfigException:
+        config.load_kube_config()
+        logger.info("Loaded local Kubernetes configuration")
+
+    return client.ApiClient()
+
+
+# Application path mappings (path prefixes are disjoint); values are ordered tuples so
+# the apps a push syncs, and the order they are synced in, are deterministic
+APP_MAPPINGS = {
+    "deployments/gitops/applications/infrastructure.yaml": (
+        "metallb",
+        "cert-manager",
+        "ingress-nginx",
+        "longhorn",
+    ),
+    "deployments/gitops/applications/monitoring.yaml": ("prometheus-stack", "loki-stack"),
+    "deployments/gitops/overlays/development/": ("homelab-apps",),
+    "deployments/gitops/overlays/staging/": ("homelab-apps",),
+    "deployments/gitops/overlays/production/": ("homelab-apps",),
+    "helm/": ("homelab-apps",),
+    "kubernetes/": ("homelab-apps",),
+}
+
+# Match every prefix in one anchored C-level regex instead of a Python loop
+_APP_PREFIXES = tuple(APP_MAPPINGS)
+_APP_PREFIX_RE = re.compile("(" + "|".join(re.escape(prefix) for prefix in APP_MAPPINGS) + ")")
+
+app.wsgi_app = HMACInputMiddleware(app.wsgi_app, paths=("/webhook/github",))
+
+# Shared, connection-pooled session for ArgoCD API calls
+argocd_session = requests.Session()
+argocd_session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+argocd_session.headers["Authorization"] = f"Bearer {ARGOCD_TOKEN}"
+
+# Sync errors are trimmed to their tail, where ArgoCD puts the actual failure reason
+SYNC_ERROR_TAIL = 512
+
+# Shared worker pool for fanning out per-application syncs across requests
+sync_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="argocd-sync")
+
+# Responses of recently handled push deliveries, keyed by X-GitHub-Delivery, so
+# redeliveries of an already-synced push do not hit ArgoCD again. The cache lives in
+# process memory: it only short-circuits redeliveries when a single worker process
+# (and a single replica) serves the webhook, as the Dockerfile configures
+DELIVERY_CACHE_SIZE = 256
+_recent_deliveries = OrderedDict()
+_recent_deliveries_lock = threading.Lock()
+
+
+def verify_signature(mac, signature_header):
+    """Verify GitHub webhook signature against the HMAC of the fully read body."""
     if not signature_header:
         logger.warning("No signature header provided")
         return False
 
-    sha_name, signature = signature_header.split("=")
+    sha_name, _, signature = signature_header.partition("=")
     if sha_name != "sha256":
         logger.warning(f"Unsupported signature type: {sha_name}")
         return False
 
-    mac = hmac.new(
-        WEBHOOK_SECRET.encode("utf-8"),
-        msg=payload_body,
-        digestmod=hashlib.sha256,
-    )
+    try:
+        signature_digest = bytes.fromhex(signature)
+    except ValueError:
+        logger.warning("Malformed signature header")
+        return False
 
-    return hmac.compare_digest(mac.hexdigest(), signature)
+    return hmac.compare_digest(mac.digest(), signature_digest)
 
 
 def trigger_argocd_sync(application_name, repository_url, branch="main"):
     """Trigger ArgoCD application sync."""
     try:
-        cmd = [
-            "argocd",
-            "app",
-            "sync",
-            application_name,
-            "--server",
-            ARGOCD_SERVER,
-            "--auth-token",
-            ARGOCD_TOKEN,
-            "--grpc-web",
-            "--prune",
-            "--force",
-        ]
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300,
-            check=False,
+        response = argocd_session.post(
+            f"https://{ARGOCD_SERVER}/api/v1/applications/{application_name}/sync",
+            json={
+                "prune": True,
+                "dryRun": False,
+                "strategy": {"apply": {"force": True}},
+            },
+            timeout=30,
         )
 
-        if result.returncode == 0:
+        if response.ok:
             logger.info(f"Successfully synced application: {application_name}")
-            return {
-                "status": "success",
-                "message": f"Application {application_name} synced successfully",
-                "output": result.stdout,
-            }
-        logger.error(f"Failed to sync application {application_name}: {result.stderr}")
+            return {"status": "success"}
+        error = response.text[-SYNC_ERROR_TAIL:]
+        logger.error(f"Failed to sync application {application_name}: {error}")
         return {
             "status": "error",
             "message": f"Failed to sync application {application_name}",
-            "error": result.stderr,
+            "error": error,
         }
 
-    except subprocess.TimeoutExpired:
+    except requests.Timeout:
         logger.exception(f"Timeout syncing application: {application_name}")
         return {
             "status": "error",
@@ -112,48 +231,89 @@ def trigger_argocd_sync(application_name, repository_url, branch="main"):
         return {
             "status": "error",
             "message": f"Exception syncing application {application_name}",
-            "error": str(e),
+            "error": str(e)[-SYNC_ERROR_TAIL:],
         }
 
 
 def get_affected_applications(repository_url, changed_files):
-    """Determine which ArgoCD applications are affected by changes."""
-    affected_apps = []
-
-    # Application path mappings
-    app_mappings = {
-        "deployments/gitops/applications/infrastructure.yaml": [
-            "metallb",
-            "cert-manager",
-            "ingress-nginx",
-            "longhorn",
-        ],
-        "deployments/gitops/applications/monitoring.yaml": ["prometheus-stack", "loki-stack"],
-        "deployments/gitops/overlays/development/": ["homelab-apps"],
-        "deployments/gitops/overlays/staging/": ["homelab-apps"],
-        "deployments/gitops/overlays/production/": ["homelab-apps"],
-        "helm/": ["homelab-apps"],
-        "kubernetes/": ["homelab-apps"],
-    }
+    """Determine which ArgoCD applications are affected by a set of changed files.
+
+    Applications come back in a deterministic, sorted-path order: files are sorted
+    before lookup, and each application is listed where its first file falls.
+    """
+    return list(_affected_apps_cached(tuple(sorted(changed_files))))
+
+
+@functools.lru_cache(maxsize=512)
+def _affected_apps_cached(changed_files):
+    """Map a sorted tuple of changed files to the affected applications, in sorted-path order."""
+    # dict keys de-duplicate like a set but keep insertion order, unlike a set
+    affected_apps = {}
 
     for file_path in changed_files:
-        for pattern, apps in app_mappings.items():
-            if file_path.startswith(pattern):
-                affected_apps.extend(apps)
+        # Most changed files match no prefix; reject them with one C-level call
+        if not file_path.startswith(_APP_PREFIXES):
+            continue
+        match = _APP_PREFIX_RE.match(file_path)
+        affected_apps.update(dict.fromkeys(APP_MAPPINGS[match.group(1)]))
+
+    return tuple(affected_apps)
+
+
+def get_cached_delivery(delivery_id):
+    """Return the stored response for an already processed delivery, if any."""
+    if not delivery_id:
+        return None
+    with _recent_deliveries_lock:
+        return _recent_deliveries.get(delivery_id)
+
+
+def remember_delivery(delivery_id, response_body):
+    """Store a delivery's response, evicting the oldest beyond DELIVERY_CACHE_SIZE."""
+    if not delivery_id:
+        return
+    with _recent_deliveries_lock:
+        _recent_deliveries[delivery_id] = response_body
+        _recent_deliveries.move_to_end(delivery_id)
+        while len(_recent_deliveries) > DELIVERY_CACHE_SIZE:
+            _recent_deliveries.popitem(last=False)
 
-    # Remove duplicates and return
-    return list(set(affected_apps))
+
+def get_notification_fields(*names):
+    """Read notification fields from the query string, falling back to the JSON body.
+
+    Senders that pass every field as ``?application=...&health=...`` skip JSON
+    parsing entirely; the body is only parsed when a field is missing.
+    """
+    args = request.args
+    if all(name in args for name in names):
+        return {name: args[name] for name in names}
+
+    payload = request.get_json()
+    if not payload:
+        abort(400)
+
+    return {name: args.get(name, payload.get(name)) for name in names}
 
 
 @app.route("/webhook/github", methods=["POST"])
 def github_webhook():
     """Handle GitHub webhook events."""
     # Verify signature
+    # Reading the body drives HMACInputMiddleware; get_json() reuses the cached bytes
     signature = request.headers.get("X-Hub-Signature-256")
-    if not verify_signature(request.data, signature):
+    request.get_data()
+    if not verify_signature(request.environ["homelab.hmac"], signature):
         logger.warning("Invalid webhook signature")
         abort(401)
 
+    # Short-circuit redeliveries of pushes that were already synced
+    delivery_id = request.headers.get("X-GitHub-Delivery")
+    cached_response = get_cached_delivery(delivery_id)
+    if cached_response is not None:
+        logger.info(f"Returning cached result for redelivered webhook: {delivery_id}")
+        return jsonify(cached_response)
+
     # Parse payload
     payload = request.get_json()
     if not payload:
@@ -165,16 +325,40 @@ def github_webhook():
 
     # Handle push events
     if event_type == "push":
+        ref = payload["ref"]
+        branch = ref.removeprefix("refs/heads/")
+        commits = payload.get("commits") or []
+
+        # Skip branch deletions, tag pushes and non-deployment branches before
+        # walking any commits
+        if payload.get("deleted") or ref == branch or branch not in DEPLOY_BRANCHES:
+            logger.info(f"Ignoring push to {ref}")
+            return jsonify(
+                {
+                    "status": "ignored",
+                    "message": f"Push to {ref} does not trigger deployments",
+                    "branch": branch,
+                },
+            )
+        if not commits:
+            logger.info(f"Ignoring push to {branch} without commits")
+            return jsonify(
+                {
+                    "status": "ignored",
+                    "message": "Push contains no commits",
+                    "branch": branch,
+                },
+            )
+
         repository_url = payload["repository"]["clone_url"]
-        branch = payload["ref"].split("/")[-1]
-        commits = payload["commits"]
 
-        # Get changed files
-        changed_files = []
-        for commit in commits:
-            changed_files.extend(commit.get("added", []))
-            changed_files.extend(commit.get("modified", []))
-            changed_files.extend(commit.get("removed", []))
+        # Get changed files, de-duplicated across commits in a single pass
+        changed_files = {
+            file_path
+            for commit in commits
+            for change_type in ("added", "modified", "removed")
+            for file_path in commit.get(change_type, ())
+        }
 
         logger.info(f"Push to {repository_url}:{branch} with {len(changed_files)} changed files")
 
@@ -190,25 +374,29 @@ def github_webhook():
                 },
             )
 
-        # Trigger sync for affected applications
-        sync_results = []
-        for app in affected_apps:
-            result = trigger_argocd_sync(app, repository_url, branch)
-            sync_results.append(
-                {
-                    "application": app,
-                    "result": result,
-                },
-            )
-
-        return jsonify(
-            {
-                "status": "success",
-                "message": f"Processed push event for {len(affected_apps)} applications",
-                "affected_applications": affected_apps,
-                "sync_results": sync_results,
-            },
+        # Trigger sync for affected applications concurrently
+        results = sync_executor.map(
+            lambda app_name: trigger_argocd_sync(app_name, repository_url, branch),
+            affected_apps,
         )
+        # (application, status) pairs serialise as compact two-element arrays
+        sync_results = [
+            (app_name, result["status"])
+            for app_name, result in zip(affected_apps, results, strict=True)
+        ]
+
+        response_body = {
+            "status": "success",
+            "message": f"Processed push event for {len(affected_apps)} applications",
+            "affected_applications": affected_apps,
+            "sync_results": sync_results,
+        }
+
+        # Only cache fully successful syncs so failed deliveries can be retried
+        if all(status == "success" for _, status in sync_results):
+            remember_delivery(delivery_id, response_body)
+
+        return jsonify(response_body)
 
     # Handle pull request events
     if event_type == "pull_request":
@@ -242,12 +430,9 @@ def github_webhook():
 @app.route("/webhook/drift", methods=["POST"])
 def drift_notification():
     """Handle drift detection notifications."""
-    payload = request.get_json()
-
-    if not payload:
-        abort(400)
+    fields = get_notification_fields("application")
 
-    logger.warning(f"Drift detected in application: {payload.get('application')}")
+    logger.warning(f"Drift detected in application: {fields['application']}")
 
     # Here you could integrate with alerting systems
     # Slack, email, PagerDuty, etc.
@@ -263,13 +448,10 @@ def drift_notification():
 @app.route("/webhook/health", methods=["POST"])
 def health_notification():
     """Handle health status notifications."""
-    payload = request.get_json()
-
-    if not payload:
-        abort(400)
+    fields = get_notification_fields("application", "health")
 
     logger.warning(
-        f"Health issue in application: {payload.get('application')} - {payload.get('health')}",
+        f"Health issue in application: {fields['application']} - {fields['health']}",
     )
 
     return jsonify(
@@ -280,18 +462,19 @@ def health_notification():
     )
 
 
+# Formatted once at import; probes only add a monotonic uptime on top
+STARTED_AT = datetime.now(timezone.utc).isoformat()
+_STARTED_MONOTONIC = time.monotonic()
+
+
 @app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint."""
     return jsonify(
         {
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "started_at": STARTED_AT,
+            "uptime_seconds": round(time.monotonic() - _STARTED_MONOTONIC, 3),
             "version": "1.0.0",
         },
     )
-
-
-if __name__ == "__main__":
-    logger.info("Starting GitOps webhook service")
-    app.run(host="0.0.0.0", port=8080, debug=False)
@@ -0,0 +1,235 @@
+"""Certificate management commands."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import click
+
+from .core.decorators import with_orchestrator
+from .core.ui import emit_json, get_console, progress_bar, report
+
+
+if TYPE_CHECKING:
+    from rich.text import Text
+
+    from .core.orchestrator import HomelabOrchestrator
+
+
+@click.group()
+@click.pass_context
+def certificates(ctx: click.Context) -> None:
+    """Certificate management operations."""
+
+
+@certificates.command("deploy")
+@click.pass_context
+@with_orchestrator
+async def certificates_deploy(ctx: click.Context, orchestrator: HomelabOrchestrator) -> None:
+    """Deploy cert-manager and certificate issuers."""
+    with progress_bar() as progress:
+        task = progress.add_task("Deploying cert-manager...", total=None)
+
+        # Deploy cert-manager
+        result = await orchestrator.certificate_manager.deploy_cert_manager()
+
+        if result["status"] == "success":
+            progress.update(
+                task,
+                description="[green]✅ cert-manager deployed successfully[/green]",
+            )
+            if "issuers" in result:
+                issuers = ", ".join(result["issuers"])
+                progress.update(task, description=f"[blue]📋 Deploying issuers: {issuers}[/blue]")
+                # Give a moment to show the success message
+        else:
+            error = result.get("error", "Unknown error")
+            progress.update(task, description=f"[red]❌ Deployment failed: {error}[/red]")
+
+
+@certificates.command("validate")
+@click.option("--format", "output_format", type=click.Choice(["table", "json"]), default="table")
+@click.pass_context
+@with_orchestrator
+async def certificates_validate(
+    ctx: click.Context,
+    output_format: str,
+    orchestrator: HomelabOrchestrator,
+) -> None:
+    """Validate TLS certificates and endpoints."""
+    result = await orchestrator.certificate_manager.validate_certificates()
+
+    if output_format == "json":
+        emit_json(result)
+        return
+
+    # Display validation results and their summary in a single write
+    summary = result.get("summary", {})
+    with report() as out:
+        out.table(
+            "Certificate Validation Results",
+            (
+                ("Endpoint", "cyan"),
+                ("Status", "bold"),
+                ("SSL Verified", "green"),
+                ("Details", None),
+            ),
+            [
+                _endpoint_validation_row(endpoint, details)
+                for endpoint, details in result.get("endpoints", {}).items()
+            ],
+        )
+        out.line(
+            f"\n📊 Summary: {summary.get('successful', 0)}/{summary.get('total', 0)} endpoints validated successfully",
+        )
+
+
+@certificates.command("check-expiry")
+@click.option("--format", "output_format", type=click.Choice(["table", "json"]), default="table")
+@click.pass_context
+@with_orchestrator
+async def certificates_check_expiry(
+    ctx: click.Context,
+    output_format: str,
+    orchestrator: HomelabOrchestrator,
+) -> None:
+    """Check certificate expiry dates."""
+    with progress_bar() as progress:
+        task = progress.add_task("Checking certificate expiry dates...", total=None)
+
+        result = await orchestrator.certificate_manager.check_certificate_expiry()
+
+        if result["status"] != "success":
+            error = result.get("error", "Unknown error")
+            progress.update(
+                task,
+                description=f"[red]❌ Failed to check certificate expiry: {error}[/red]",
+            )
+            return
+
+        total_certs = len(result.get("certificates", []))
+        needs_renewal = sum(
+            1 for cert in result.get("certificates", []) if cert.get("needs_renewal")
+        )
+
+        status_desc = f"[green]✅ Checked {total_certs} certificates[/green]"
+        if needs_renewal > 0:
+            status_desc += f" ([yellow]⚠️ {needs_renewal} need renewal[/yellow])"
+        progress.update(task, description=status_desc)
+
+    if output_format == "json":
+        emit_json(result)
+        return
+
+    # Display certificate expiry information and its summary in a single write
+    summary = result.get("summary", {})
+    with report() as out:
+        out.table(
+            "Certificate Expiry Information",
+            (
+                ("Certificate", "cyan"),
+                ("Namespace", None),
+                ("Days Until Expiry", "bold"),
+                ("Status", None),
+                ("Needs Renewal", None),
+            ),
+            [_certificate_expiry_row(cert) for cert in result.get("certificates", [])],
+            # Both columns hold short fixed-size values, so pin their width to the
+            # header and let Rich skip measuring every row for them
+            column_options={
+                "Days Until Expiry": {"width": len("Days Until Expiry"), "no_wrap": True},
+                "Needs Renewal": {"width": len("Needs Renewal"), "no_wrap": True},
+            },
+        )
+        out.line(
+            f"\n📊 Summary: {summary.get('needs_renewal', 0)}/{summary.get('total', 0)} certificates need renewal",
+        )
+
+
+@certificates.command("renew")
+@click.argument("cert_name")
+@click.option("--namespace", default="default", help="Certificate namespace")
+@click.pass_context
+@with_orchestrator
+async def certificates_renew(
+    ctx: click.Context,
+    cert_name: str,
+    namespace: str,
+    orchestrator: HomelabOrchestrator,
+) -> None:
+    """Force renewal of a specific certificate."""
+    from rich.panel import Panel
+
+    console = get_console()
+
+    with progress_bar() as progress:
+        task = progress.add_task(f"Initiating renewal of certificate '{cert_name}'...", total=None)
+
+        result = await orchestrator.certificate_manager.renew_certificate(cert_name, namespace)
+
+        if result["status"] == "success":
+            progress.update(
+                task,
+                description=f"[green]✅ Certificate '{cert_name}' renewal triggered successfully[/green]",
+            )
+
+            # Show monitoring info
+            monitoring_msg = (
+                f"[blue]ℹ️ Monitor renewal status:[/blue]\n"
+                f"[dim]kubectl describe certificate {cert_name} -n {namespace}[/dim]"
+            )
+            console.print(Panel(monitoring_msg, title="Next Steps", expand=False))
+        else:
+            error = result.get("error", "Unknown error")
+            progress.update(
+                task,
+                description=f"[red]❌ Certificate renewal failed: {error}[/red]",
+            )
+
+
+# Display helper functions
+
+
+def _endpoint_validation_row(endpoint: str, details: dict[str, Any]) -> tuple[str | Text, ...]:
+    """Format one endpoint of a certificate validation result as a table row."""
+    from rich.text import Text
+
+    status = details["status"]
+    status_color = "green" if status == "success" else "red"
+    ssl_status = "✅" if details.get("ssl_verified") else "❌"
+
+    error_info = details.get("error", "")
+    if details.get("status_code"):
+        error_info = f"HTTP {details['status_code']}"
+    elif details.get("expires"):
+        error_info = f"Expires {details['expires']}"
+
+    # Endpoints (e.g. https://[fe80::1]) and error text are data, not markup
+    return (
+        Text(endpoint),
+        Text(status.upper(), style=status_color),
+        ssl_status,
+        Text(error_info),
+    )
+
+
+def _certificate_expiry_row(cert: dict[str, Any]) -> tuple[str | Text, ...]:
+    """Format one certificate of an expiry check as a table row."""
+    from rich.text import Text
+
+    days_color = (
+        "red"
+        if cert["days_until_expiry"] < 7
+        else "yellow"
+        if cert["days_until_expiry"] < 30
+        else "green"
+    )
+    renewal_status = "⚠️ YES" if cert["needs_renewal"] else "✅ NO"
+
+    return (
+        Text(cert["name"]),
+        Text(cert["namespace"]),
+        Text(str(cert["days_until_expiry"]), style=days_color),
+        Text(cert["status"]),
+        renewal_status,
+    )
@@ -0,0 +1,98 @@
+"""Configuration management commands."""
+
+from __future__ import annotations
+
+import sys
+
+import click
+
+from .core.ui import emit_json, get_console, report
+
+
+# Status cells shared by every issue/warning row of a validation report
+_ERROR_CELL = "[red]ERROR[/red]"
+_WARNING_CELL = "[yellow]WARNING[/yellow]"
+
+
+@click.group()
+@click.pass_context
+def config(ctx: click.Context) -> None:
+    """Configuration management."""
+
+
+@config.command("validate")
+@click.option("--comprehensive", is_flag=True, help="Run comprehensive validation")
+@click.pass_context
+def config_validate(ctx: click.Context, comprehensive: bool) -> None:
+    """Validate configuration files."""
+    from rich.text import Text
+
+    config_manager = ctx.obj["config_manager"]
+
+    get_console().print("[blue]Validating configuration...[/blue]")
+
+    validation_result = config_manager.validate_configuration()
+
+    status_color = "green" if validation_result["status"] == "valid" else "red"
+    rows = [
+        # Overall status
+        (
+            "Overall Status",
+            f"[{status_color}]{validation_result['status'].upper()}[/{status_color}]",
+            f"Environment: {validation_result['environment']}",
+        ),
+        # Configuration files
+        (
+            "Config Files",
+            f"[green]{validation_result['config_files_loaded']}[/green]",
+            "Configuration files loaded",
+        ),
+    ]
+    rows.extend(("Issue", _ERROR_CELL, Text(issue)) for issue in validation_result["issues"] or ())
+    rows.extend(
+        ("Warning", _WARNING_CELL, Text(warning)) for warning in validation_result["warnings"] or ()
+    )
+
+    with report() as out:
+        out.table(
+            "Configuration Validation Results",
+            (("Check", "cyan"), ("Status", "bold"), ("Details", None)),
+            rows,
+        )
+
+    if validation_result["status"] != "valid":
+        sys.exit(1)
+
+
+@config.command("show")
+@click.argument("config_type", required=False)
+@click.option("--key", help="Specific configuration key")
+@click.option("--format", "output_format", type=click.Choice(["yaml", "json"]), default="yaml")
+@click.pass_context
+def config_show(
+    ctx: click.Context,
+    config_type: str | None,
+    key: str | None,
+    output_format: str,
+) -> None:
+    """Show configuration values."""
+    config_manager = ctx.obj["config_manager"]
+
+    if config_type:
+        config_data = config_manager.get_config(config_type, key)
+    else:
+        config_data = config_manager.get_deployment_config()
+
+    if output_format == "json":
+        emit_json(config_data)
+    else:
+        import yaml
+
+        try:
+            from yaml import CSafeDumper as Dumper  # libyaml-backed emitter
+        except ImportError:
+            from yaml import SafeDumper as Dumper
+
+        sys.stdout.write(
+            yaml.dump(config_data, Dumper=Dumper, default_flow_style=False, sort_keys=False),
+        )
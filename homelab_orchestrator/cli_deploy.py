@@ -0,0 +1,273 @@
+"""Deployment and lifecycle management commands."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import click
+
+from .core.decorators import with_orchestrator
+from .core.ui import progress_bar, report, status_markup
+
+
+if TYPE_CHECKING:
+    from rich.text import Text
+
+    from .core.orchestrator import HomelabOrchestrator
+    from .core.ui import PlainReport, RichReport
+
+
+@click.group()
+@click.pass_context
+def deploy(ctx: click.Context) -> None:
+    """Deployment operations."""
+
+
+@deploy.command("infrastructure")
+@click.option("--components", multiple=True, help="Specific components to deploy")
+@click.option("--dry-run", is_flag=True, help="Perform validation without deployment")
+@click.option("--skip-hooks", is_flag=True, help="Skip deployment hooks")
+@click.pass_context
+@with_orchestrator
+async def deploy_infrastructure(
+    ctx: click.Context,
+    components: list[str],
+    dry_run: bool,
+    skip_hooks: bool,
+    orchestrator: HomelabOrchestrator,
+) -> None:
+    """Deploy complete homelab infrastructure."""
+    with progress_bar() as progress:
+        task = progress.add_task("Deploying infrastructure...", total=None)
+
+        result = await orchestrator.deploy_full_infrastructure(
+            components=list(components) if components else None,
+            dry_run=dry_run,
+        )
+
+        progress.update(task, description="Deployment completed", completed=100)
+
+        # Display results
+        _display_deployment_result(result)
+
+
+@deploy.command("service")
+@click.argument("service_name")
+@click.option("--namespace", help="Target namespace")
+@click.option("--dry-run", is_flag=True, help="Validate without deployment")
+@click.pass_context
+@with_orchestrator
+async def deploy_service(
+    ctx: click.Context,
+    service_name: str,
+    namespace: str | None,
+    dry_run: bool,
+    orchestrator: HomelabOrchestrator,
+) -> None:
+    """Deploy specific service."""
+    with progress_bar() as progress:
+        task = progress.add_task(f"Deploying service: {service_name}...", total=None)
+
+        if dry_run:
+            progress.update(task, description="[blue]🔍 Dry run mode - validating only[/blue]")
+
+        result = await orchestrator.service_manager.deploy_service(
+            service_name,
+            namespace=namespace,
+            dry_run=dry_run,
+        )
+
+        if result["status"] == "success":
+            progress.update(
+                task,
+                description=f"[green]✅ Service {service_name} deployed successfully[/green]",
+            )
+        else:
+            error = result.get("error", "Unknown error")
+            progress.update(task, description=f"[red]❌ Service deployment failed: {error}[/red]")
+
+
+@click.group()
+@click.pass_context
+def manage(ctx: click.Context) -> None:
+    """Backup, Teardown, and Recovery operations."""
+
+
+@manage.command("backup")
+@click.option("--components", multiple=True, help="Specific components to backup")
+@click.pass_context
+@with_orchestrator
+async def manage_backup(
+    ctx: click.Context,
+    components: list[str],
+    orchestrator: HomelabOrchestrator,
+) -> None:
+    """Backup infrastructure components."""
+    with progress_bar() as progress:
+        task = progress.add_task("Backing up infrastructure components...", total=None)
+
+        result = await orchestrator.deployment_manager.backup_infrastructure(components)
+
+        progress.update(task, description="Backup completed", completed=100)
+        _display_deployment_result(result)
+
+
+@manage.command("teardown")
+@click.option("--force", is_flag=True, help="Force teardown without confirmation")
+@click.option("--no-backup", is_flag=True, help="Skip backup before teardown")
+@click.pass_context
+@with_orchestrator
+async def manage_teardown(
+    ctx: click.Context,
+    force: bool,
+    no_backup: bool,
+    orchestrator: HomelabOrchestrator,
+) -> None:
+    """Teardown complete infrastructure."""
+    with progress_bar() as progress:
+        task = progress.add_task("Tearing down infrastructure...", total=None)
+
+        result = await orchestrator.teardown_infrastructure(
+            environment=orchestrator.config_manager.context.environment,
+            force=force,
+            backup=not no_backup,
+        )
+
+        progress.update(task, description="Teardown completed", completed=100)
+        _display_teardown_result(result)
+
+
+@manage.command("recover")
+@click.option("--components", multiple=True, help="Specific components to recover")
+@click.pass_context
+@with_orchestrator
+async def manage_recover(
+    ctx: click.Context,
+    components: list[str],
+    orchestrator: HomelabOrchestrator,
+) -> None:
+    """Recover infrastructure components from backup."""
+    with progress_bar() as progress:
+        task = progress.add_task("Recovering infrastructure components...", total=None)
+
+        result = await orchestrator.deployment_manager.recover_infrastructure(components)
+
+        progress.update(task, description="Recovery completed", completed=100)
+        _display_deployment_result(result)
+
+
+# Display helper functions
+
+
+def _validation_status_text(status: str) -> Text:
+    """Return the styled table cell for a deployment validation check status."""
+    from rich.text import Text
+
+    if status == "passed":
+        return Text("✅ PASSED", style="green")
+    if status == "failed":
+        return Text("❌ FAILED", style="red")
+    return Text(f"❓ {status.upper()}", style="yellow")
+
+
+def _display_deployment_result(result: Any) -> None:
+    """Display deployment results in a nice format."""
+    from rich.text import Text
+
+    with report() as out:
+        out.panel(
+            f"{status_markup(result.status)}\n"
+            f"Operation: {result.operation}\n"
+            f"Duration: {result.duration:.2f}s",
+            title="Deployment Result",
+        )
+
+        # Both DeploymentResult and OrchestrationResult carry details; only the
+        # former tracks per-component outcomes
+        details = result.details
+        components_deployed = getattr(result, "components_deployed", None)
+        components_failed = getattr(result, "components_failed", None)
+
+        # Display comprehensive validation results if available
+        if "comprehensive_validation" in details:
+            validation = details["comprehensive_validation"]
+            if "validation_details" in validation:
+                _display_validation_details(out, validation["validation_details"])
+
+        if components_deployed:
+            out.table(
+                "Deployed Components",
+                (("Component", "green"), ("Status", "bold")),
+                [
+                    (Text(component), Text("SUCCESS", style="green"))
+                    for component in components_deployed
+                ],
+            )
+
+        if components_failed:
+            out.table(
+                "Failed Components",
+                (("Component", "red"), ("Status", "bold")),
+                [(Text(component), Text("FAILED", style="red")) for component in components_failed],
+            )
+
+        _display_recommendations(out, result.recommendations)
+
+
+def _display_teardown_result(result: Any) -> None:
+    """Display teardown results in a nice format."""
+    from rich.text import Text
+
+    with report() as out:
+        out.panel(
+            f"{status_markup(result.status)}\n"
+            f"Operation: {result.operation}\n"
+            f"Duration: {result.duration:.2f}s",
+            title="Teardown Result",
+        )
+
+        # Display clean state validation if available
+        if "validation" in result.details:
+            validation = result.details["validation"]
+
+            clean_status = "✅ CLEAN" if validation.get("clean", False) else "❌ NOT CLEAN"
+            rows = [("Overall State", clean_status, "")]
+            rows.extend(
+                ("Issue", Text("FOUND", style="red"), Text(issue))
+                for issue in validation.get("issues") or ()
+            )
+
+            out.table(
+                "Clean State Validation",
+                (("Check", "cyan"), ("Status", "bold"), ("Details", None)),
+                rows,
+            )
+
+        _display_recommendations(out, result.recommendations)
+
+
+def _display_validation_details(
+    out: RichReport | PlainReport,
+    validation_details: dict[str, Any],
+) -> None:
+    """Display validation details in a structured format."""
+    out.table(
+        "Deployment Validation Details",
+        (("Component", "cyan"), ("Status", "bold")),
+        [
+            (component.replace("_", " ").title(), _validation_status_text(status))
+            for component, status in validation_details.items()
+        ],
+    )
+
+
+def _display_recommendations(out: RichReport | PlainReport, recommendations: list[str]) -> None:
+    """Display a numbered list of recommendations, if there are any."""
+    if not recommendations:
+        return
+
+    from rich.markup import escape
+
+    out.line("\n[yellow]Recommendations:[/yellow]")
+    for i, rec in enumerate(recommendations, 1):
+        out.line(f"  {i}. {escape(rec)}")
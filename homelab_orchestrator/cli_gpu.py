@@ -0,0 +1,101 @@
+"""GPU resource management commands."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import click
+
+from .core.decorators import with_orchestrator
+from .core.ui import emit_json, progress_bar, report
+
+
+if TYPE_CHECKING:
+    from .core.orchestrator import HomelabOrchestrator
+
+
+@click.group()
+@click.pass_context
+def gpu(ctx: click.Context) -> None:
+    """GPU resource management."""
+
+
+@gpu.command("discover")
+@click.option("--format", "output_format", type=click.Choice(["table", "json"]), default="table")
+@click.pass_context
+@with_orchestrator
+async def gpu_discover(
+    ctx: click.Context,
+    output_format: str,
+    orchestrator: HomelabOrchestrator,
+) -> None:
+    """Discover available GPU resources."""
+    with progress_bar() as progress:
+        task = progress.add_task("Discovering GPU resources...", total=None)
+
+        result = await orchestrator.manage_gpu_resources("discover")
+
+        progress.update(task, description="GPU discovery completed", completed=100)
+        _display_gpu_result(result, output_format)
+
+
+@gpu.command("status")
+@click.option("--format", "output_format", type=click.Choice(["table", "json"]), default="table")
+@click.pass_context
+@with_orchestrator
+async def gpu_status(
+    ctx: click.Context,
+    output_format: str,
+    orchestrator: HomelabOrchestrator,
+) -> None:
+    """Show GPU resource status."""
+    with progress_bar() as progress:
+        task = progress.add_task("Fetching GPU status...", total=None)
+
+        result = await orchestrator.manage_gpu_resources("monitor")
+
+        progress.update(task, description="GPU status check completed", completed=100)
+        _display_gpu_result(result, output_format)
+
+
+# Display helper functions
+
+
+def _gpu_row(gpu_id: str, gpu_data: dict[str, Any]) -> tuple[str, ...]:
+    """Format one GPU of a discovery/monitoring result as a table row."""
+    memory_info = f"{gpu_data.get('memory_used', 0)}MB / {gpu_data.get('memory_total', 0)}MB"
+    utilization = f"{gpu_data.get('utilization', 0):.1f}%"
+    available = "✅" if gpu_data.get("available", False) else "❌"
+
+    return (gpu_id, gpu_data.get("name", "Unknown"), memory_info, utilization, available)
+
+
+def _display_gpu_result(result: Any, output_format: str) -> None:
+    """Display GPU management results."""
+    if output_format == "json":
+        emit_json(result.details)
+        return
+
+    with report() as out:
+        if result.status == "success" and result.details:
+            gpus = result.details.get("gpus", {})
+
+            if gpus:
+                out.table(
+                    "GPU Resources",
+                    (
+                        ("GPU ID", "cyan"),
+                        ("Name", "bold"),
+                        ("Memory", "green"),
+                        ("Utilization", "yellow"),
+                        ("Available", "blue"),
+                    ),
+                    [_gpu_row(gpu_id, gpu_data) for gpu_id, gpu_data in gpus.items()],
+                )
+            else:
+                out.line("[yellow]No GPU resources found[/yellow]")
+        else:
+            from rich.markup import escape
+
+            error = escape(str(result.details.get("error", "Unknown error")))
+            out.line(f"[red]GPU operation failed: {error}[/red]")
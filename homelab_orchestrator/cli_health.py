@@ -0,0 +1,150 @@
+"""Health monitoring and system status commands."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import click
+
+from .core.decorators import with_orchestrator
+from .core.ui import emit_json, get_console, progress_bar, report, status_markup
+
+
+if TYPE_CHECKING:
+    from .core.orchestrator import HomelabOrchestrator
+
+
+@click.group()
+@click.pass_context
+def health(ctx: click.Context) -> None:
+    """Health monitoring and validation."""
+
+
+@health.command("check")
+@click.option("--comprehensive", is_flag=True, help="Run comprehensive health check")
+@click.option("--component", multiple=True, help="Check specific components")
+@click.option("--format", "output_format", type=click.Choice(["table", "json"]), default="table")
+@click.pass_context
+@with_orchestrator
+async def health_check(
+    ctx: click.Context,
+    comprehensive: bool,
+    component: list[str],
+    output_format: str,
+    orchestrator: HomelabOrchestrator,
+) -> None:
+    """Check system health status."""
+    with progress_bar() as progress:
+        task = progress.add_task("Running health checks...", total=None)
+
+        result = await orchestrator.validate_system_health()
+
+        progress.update(task, description="Health check completed", completed=100)
+        _display_health_result(result, output_format)
+
+
+@health.command("monitor")
+@click.option("--interval", default=60, help="Monitoring interval in seconds")
+@click.option("--duration", default=0, help="Monitoring duration in seconds (0 for continuous)")
+@click.pass_context
+def health_monitor(ctx: click.Context, interval: int, duration: int) -> None:
+    """Start continuous health monitoring."""
+    console = get_console()
+
+    console.print(f"[blue]Starting health monitoring (interval: {interval}s)[/blue]")
+
+    if duration > 0:
+        console.print(f"[blue]Monitoring duration: {duration}s[/blue]")
+    else:
+        console.print("[blue]Continuous monitoring (Ctrl+C to stop)[/blue]")
+
+    # Implementation for continuous monitoring
+    console.print("[green]Health monitoring started[/green]")
+
+
+@click.command("status")
+@click.option("--format", "output_format", type=click.Choice(["table", "json"]), default="table")
+@click.pass_context
+@with_orchestrator
+def status(ctx: click.Context, output_format: str, orchestrator: HomelabOrchestrator) -> None:
+    """Show overall system status."""
+    # Get system status
+    system_status = orchestrator.get_system_status()
+
+    if output_format == "json":
+        emit_json(system_status)
+    else:
+        _display_system_status(system_status)
+
+
+# Display helper functions
+
+
+def _display_health_result(result: Any, output_format: str) -> None:
+    """Display health check results."""
+    if output_format == "json":
+        emit_json(result.details)
+        return
+
+    from rich.text import Text
+
+    with report() as out:
+        out.panel(
+            f"{status_markup(result.status)}\nDuration: {result.duration:.2f}s",
+            title="Health Check Result",
+        )
+
+        if result.details:
+            for component, details in result.details.items():
+                rows = (
+                    [
+                        ("Status", Text(f"{'✅' if value == 'healthy' else '❌'} {value}"), "")
+                        if key == "status"
+                        else (key, Text(str(value)), "")
+                        for key, value in details.items()
+                    ]
+                    if isinstance(details, dict)
+                    else ()
+                )
+                out.table(
+                    f"{component.title()} Health",
+                    (("Check", "cyan"), ("Status", "bold"), ("Details", None)),
+                    rows,
+                )
+
+
+def _display_system_status(status: dict[str, Any]) -> None:
+    """Display system status in table format."""
+    orchestrator_status = status.get("orchestrator", {})
+    config_status = status.get("configuration", {})
+
+    rows = [
+        (
+            "Orchestrator",
+            "[green]RUNNING[/green]",
+            (
+                f"Queue: {orchestrator_status.get('event_queue_size', 0)}, "
+                f"Tasks: {orchestrator_status.get('running_tasks', 0)}"
+            ),
+        ),
+        (
+            "Configuration",
+            "[green]LOADED[/green]",
+            (
+                f"Environment: {config_status.get('environment', 'unknown')}, "
+                f"Type: {config_status.get('cluster_type', 'unknown')}"
+            ),
+        ),
+    ]
+    # Managers status
+    rows.extend(
+        (manager.title(), "[green]ENABLED[/green]" if enabled else "[gray]DISABLED[/gray]", "")
+        for manager, enabled in status.get("managers", {}).items()
+    )
+
+    with report() as out:
+        out.table(
+            "System Status",
+            (("Component", "cyan"), ("Status", "bold"), ("Details", None)),
+            rows,
+        )
@@ -0,0 +1,27 @@
+"""Webhook management commands."""
+
+from __future__ import annotations
+
+import click
+
+from .core.ui import get_console
+
+
+@click.group()
+@click.pass_context
+def webhook(ctx: click.Context) -> None:
+    """Webhook management."""
+
+
+@webhook.command("start")
+@click.option("--host", default="0.0.0.0", help="Host to bind to")
+@click.option("--port", default=8080, help="Port to bind to")
+@click.pass_context
+def webhook_start(ctx: click.Context, host: str, port: int) -> None:
+    """Start webhook server."""
+    console = get_console()
+
+    console.print(f"[blue]Starting webhook server on {host}:{port}[/blue]")
+
+    # Implementation for webhook server
+    console.print("[green]Webhook server started[/green]")
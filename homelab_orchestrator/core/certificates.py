@@ -6,26 +6,69 @@ Supports Let's Encrypt, custom CA, and self-signed certificates through cert-man
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
 import logging
 import ssl
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from functools import wraps
+from functools import cache, partial, wraps
+from http import HTTPStatus
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar
+from urllib.parse import urlsplit
 
 import aiohttp
+import yaml
 from dateutil import parser as dateutil_parser
 
-from kubernetes import client, config
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
+from kubernetes.watch.watch import iter_resp_lines
+
+from .ui import progress_bar
+
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    orjson = None
+
+# Decoder for raw API response bodies and watch event lines
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
 
 T = TypeVar("T")
 
 
+@cache
+def _ssl_context() -> ssl.SSLContext:
+    """Return the shared client SSL context, loading the CA bundle on first use.
+
+    Returns:
+        Process-wide default-verification context
+    """
+    return ssl.create_default_context()
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a Kubernetes RFC 3339 timestamp with the stdlib parser.
+
+    fromisoformat only accepts a trailing "Z" from Python 3.11, so it is
+    rewritten as an explicit UTC offset first.
+    """
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
 def handle_cert_errors(f: Callable[..., T]) -> Callable[..., T]:
     """Decorator for handling certificate operation errors."""
 
@@ -43,12 +86,36 @@ def handle_cert_errors(f: Callable[..., T]) -> Callable[..., T]:
     return wrapper
 
 
+# Seconds a cluster-wide certificate listing is reused by expiry checks
+CERTIFICATE_CACHE_TTL = 30
+
+# Seconds each certificate watch runs before a full relist reconciles the index
+CERTIFICATE_RESYNC_SECONDS = 60
+
+# Seconds allowed for the TCP connect and TLS handshake of an endpoint probe
+TLS_PROBE_TIMEOUT = 10
+
+# Label selector matching the cert-manager controller pods
+CERT_MANAGER_POD_SELECTOR = "app.kubernetes.io/name=cert-manager"
+
+# Field manager recorded on every object the orchestrator applies
+FIELD_MANAGER = "homelab-orchestrator"
+
+# Issuer manifest applied once cert-manager is running
+ISSUERS_MANIFEST = Path("kubernetes/base/cert-manager-issuers.yaml")
+
 # Default configuration for certificate issuers
 ISSUER_DEFAULTS = {
     "readiness_timeout": 300,
     "polling_interval": 10,
 }
 
+# Default limits for endpoint validation
+VALIDATION_DEFAULTS = {
+    "max_concurrency": 16,
+    "endpoint_timeout": 15,
+}
+
 
 if TYPE_CHECKING:
     from .config_manager import ConfigManager
@@ -72,235 +139,390 @@ class CertificateManager:
         # HTTP session for certificate validation
         self.http_session: aiohttp.ClientSession | None = None
 
+        # Kubernetes API clients, built once in start() and shared by every call
+        self._core_v1: client.CoreV1Api | None = None
+        self._custom_api: client.CustomObjectsApi | None = None
+        # Built on first manifest apply, as it starts API discovery
+        self._dynamic_client: DynamicClient | None = None
+
+        # (monotonic time of listing, items) from the last cluster-wide certificate LIST
+        self._certificates_cache: tuple[float, list[dict[str, Any]]] | None = None
+
+        # (namespace, name) -> (resourceVersion, parsed notAfter, Ready status) from
+        # the last expiry check; both only change when the object does
+        self._expiry_cache: dict[tuple[str, str], tuple[str, datetime, str]] = {}
+
+        # Certificates by (namespace, name), kept current by the optional watch
+        # thread; None until its first listing completes
+        self._certificate_index: dict[tuple[str, str], dict[str, Any]] | None = None
+        self._certificate_index_lock = threading.Lock()
+        self._certificate_watcher: threading.Thread | None = None
+        self._stop_watching = threading.Event()
+
     async def start(self) -> None:
         """Start certificate manager services."""
         self.logger.info("Starting certificate manager")
 
-        # Initialize HTTP session for certificate validation
+        # Initialize HTTP session for certificate validation. Endpoints are checked
+        # concurrently and often share a host (the ingress), so keep resolved
+        # addresses and idle TLS connections around for the whole run
+        health_checks = self.cert_config.get("validation", {}).get("health_checks", {})
+        endpoints = health_checks.get("endpoints", [])
         connector = aiohttp.TCPConnector(
-            ssl=ssl.create_default_context(),
-            limit=10,
-            limit_per_host=3,
+            ssl=_ssl_context(),
+            limit=max(32, len(endpoints)),
+            limit_per_host=8,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
         )
         self.http_session = aiohttp.ClientSession(
             connector=connector,
-            timeout=aiohttp.ClientTimeout(total=30),
+            # Fail unreachable or stalled endpoints early instead of letting them
+            # hold a connection slot for the whole 30 seconds
+            timeout=aiohttp.ClientTimeout(total=30, connect=5, sock_read=10),
         )
 
+        self._init_kube_clients()
+
+        if self._custom_api and self.cert_config.get("watch_certificates", False):
+            self._start_certificate_watch()
+
     async def stop(self) -> None:
         """Stop certificate manager services."""
         self.logger.info("Stopping certificate manager")
 
+        if self._certificate_watcher:
+            # The thread exits once its current watch request returns
+            self._stop_watching.set()
+            self._certificate_watcher = None
+            self._certificate_index = None
+
         if self.http_session:
             await self.http_session.close()
             self.http_session = None
 
+        if self._core_v1:
+            # Both APIs share one ApiClient and its connection pool
+            self._core_v1.api_client.close()
+            self._core_v1 = None
+            self._custom_api = None
+            self._dynamic_client = None
+
+    def _init_kube_clients(self) -> None:
+        """Load cluster credentials once and build the shared Kubernetes API clients."""
+        try:
+            # Try in-cluster config first, fallback to local kubeconfig
+            try:
+                config.load_incluster_config()
+            except config.ConfigException:
+                config.load_kube_config()
+        except (config.ConfigException, OSError) as e:
+            self.logger.warning(f"Kubernetes configuration unavailable: {e}")
+            return
+
+        api_client = client.ApiClient()
+        self._core_v1 = client.CoreV1Api(api_client)
+        self._custom_api = client.CustomObjectsApi(api_client)
+
+    def _require_kube_clients(self) -> tuple[client.CoreV1Api, client.CustomObjectsApi]:
+        """Return the shared Kubernetes API clients.
+
+        Raises:
+            RuntimeError: If start() has not loaded a cluster configuration
+        """
+        if self._core_v1 is None or self._custom_api is None:
+            msg = "Kubernetes API not configured; start() could not load cluster credentials"
+            raise RuntimeError(msg)
+        return self._core_v1, self._custom_api
+
+    async def _fetch_manifest(self, url: str) -> str:
+        """Download a remote manifest over the shared HTTP session."""
+        if not self.http_session:
+            msg = "Certificate manager not started"
+            raise RuntimeError(msg)
+
+        async with self.http_session.get(url) as response:
+            response.raise_for_status()
+            return await response.text()
+
+    def _apply_manifests(self, *manifests: str) -> int:
+        """Server-side apply every document of one or more multi-document manifests.
+
+        This is the API-client equivalent of a single kubectl apply over all the
+        manifests: objects are created or updated in place, and fields previously
+        set by kubectl are taken over. An object defined in more than one manifest
+        is applied once, with its last definition. It blocks, so callers run it in
+        the default executor.
+
+        Args:
+            manifests: YAML texts, each possibly holding several documents
+
+        Returns:
+            Number of objects applied
+        """
+        core_v1, _ = self._require_kube_clients()
+        if self._dynamic_client is None:
+            self._dynamic_client = DynamicClient(core_v1.api_client)
+        dynamic = self._dynamic_client
+
+        # Keyed by object identity; the first definition fixes the apply order
+        documents: dict[tuple[str, str, str | None, str], dict[str, Any]] = {}
+        for manifest in manifests:
+            for document in yaml.safe_load_all(manifest):
+                if not document:
+                    continue
+                metadata = document["metadata"]
+                key = (
+                    document["apiVersion"],
+                    document["kind"],
+                    metadata.get("namespace"),
+                    metadata["name"],
+                )
+                documents[key] = document
+
+        for document in documents.values():
+            resource = dynamic.resources.get(
+                api_version=document["apiVersion"],
+                kind=document["kind"],
+            )
+            namespace = None
+            if resource.namespaced:
+                # Like kubectl, namespaced objects that name none land in default
+                namespace = document["metadata"].get("namespace", "default")
+
+            dynamic.server_side_apply(
+                resource,
+                body=document,
+                namespace=namespace,
+                field_manager=FIELD_MANAGER,
+                force_conflicts=True,
+            )
+
+        return len(documents)
+
     @handle_cert_errors
     async def deploy_cert_manager(self) -> dict[str, Any]:
         """Deploy cert-manager with issuers."""
         self.logger.info("Deploying cert-manager")
 
-        from ..core.ui import progress_bar
+        loop = asyncio.get_running_loop()
 
         with progress_bar() as progress:
             task = progress.add_task("Deploying cert-manager...", total=None)
 
+            # Deploy cert-manager CRDs and controller
+            cert_manager_urls = [
+                "https://github.com/cert-manager/cert-manager/releases/download/v1.13.3/cert-manager.crds.yaml",
+                "https://github.com/cert-manager/cert-manager/releases/download/v1.13.3/cert-manager.yaml",
+            ]
+
+            # Create namespace first; an existing one is left as it is
+            progress.update(task, description="Creating cert-manager namespace...")
+            core_v1, _ = self._require_kube_clients()
+            namespace = client.V1Namespace(metadata=client.V1ObjectMeta(name="cert-manager"))
             try:
-                # Deploy cert-manager CRDs and controller
-                cert_manager_urls = [
-                    "https://github.com/cert-manager/cert-manager/releases/download/v1.13.3/cert-manager.crds.yaml",
-                    "https://github.com/cert-manager/cert-manager/releases/download/v1.13.3/cert-manager.yaml",
-                ]
-
-                # Create namespace first
-                progress.update(task, description="Creating cert-manager namespace...")
-                # Use fixed command array instead of split
-                result = await asyncio.create_subprocess_exec(
-                    "kubectl",
-                    "create",
-                    "namespace",
-                    "cert-manager",
-                    "--dry-run=client",
-                    "-o",
-                    "yaml",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                stdout, stderr = await result.communicate()
-
-                if result.returncode == 0:
-                    result = await asyncio.create_subprocess_exec(
-                        "kubectl",
-                        "apply",
-                        "-f",
-                        "-",
-                        stdin=asyncio.subprocess.PIPE,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
-                    )
-                    stdout, stderr = await result.communicate(input=stdout)
-
-                if result.returncode != 0:
+                await loop.run_in_executor(None, core_v1.create_namespace, namespace)
+            except ApiException as e:
+                if e.status != HTTPStatus.CONFLICT:
                     progress.update(task, description="[red]Failed to create namespace[/red]")
                     return {
                         "status": "failed",
-                        "error": "Failed to create namespace",
-                        "stderr": stderr.decode(),
+                        "error": f"Failed to create namespace: {e.reason}",
                     }
 
-                # Apply cert-manager manifests
-                for url in cert_manager_urls:
-                    progress.update(task, description=f"Applying manifest from {url}...")
-                    result = await asyncio.create_subprocess_exec(
-                        "kubectl",
-                        "apply",
-                        "-f",
-                        url,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
-                    )
-                    stdout, stderr = await result.communicate()
-
-                    if result.returncode != 0:
-                        self.logger.error(f"Cert-manager deployment failed: {stderr.decode()}")
-                        progress.update(task, description="[red]Deployment failed")
-                        return {
-                            "status": "failed",
-                            "error": f"Failed to apply manifest from {url}",
-                            "stderr": stderr.decode(),
-                        }
-
-                # Wait for cert-manager to be ready
-                progress.update(task, description="Waiting for cert-manager to be ready...")
-                await self._wait_for_cert_manager_ready()
-
-                # Deploy issuers
-                progress.update(task, description="Deploying issuers...")
-                issuer_result = await self._deploy_issuers()
-                if issuer_result["status"] != "success":
-                    return issuer_result
-
-                progress.update(task, description="cert-manager deployed successfully")
-                return {
-                    "status": "success",
-                    "message": "cert-manager deployed successfully",
-                    "issuers": issuer_result.get("issuers", []),
-                }
-
-            except Exception as e:
-                progress.update(task, description=f"[red]Error: {e!s}")
-                self.logger.exception(f"cert-manager deployment failed: {e}")
+            # Download each manifest once and apply them together through the
+            # shared API client instead of a kubectl process that re-fetches the URLs
+            progress.update(task, description="Applying cert-manager manifests...")
+            try:
+                manifests = await asyncio.gather(
+                    *(self._fetch_manifest(url) for url in cert_manager_urls),
+                )
+                await loop.run_in_executor(None, self._apply_manifests, *manifests)
+            except (aiohttp.ClientError, ApiException, ResourceNotFoundError) as e:
+                self.logger.exception(f"Cert-manager deployment failed: {e}")
+                progress.update(task, description="[red]Deployment failed")
                 return {
                     "status": "failed",
-                    "error": str(e),
+                    "error": f"Failed to apply cert-manager manifests: {e}",
                 }
 
+            # Wait for cert-manager to be ready
+            progress.update(task, description="Waiting for cert-manager to be ready...")
+            await self._wait_for_cert_manager_ready()
+
+            # Deploy issuers
+            progress.update(task, description="Deploying issuers...")
+            issuer_result = await self._deploy_issuers()
+            if issuer_result["status"] != "success":
+                return issuer_result
+
+            progress.update(task, description="cert-manager deployed successfully")
+            return {
+                "status": "success",
+                "message": "cert-manager deployed successfully",
+                "issuers": issuer_result.get("issuers", []),
+            }
+
     async def _wait_for_cert_manager_ready(self, timeout: int = 300) -> bool:
-        """Wait for cert-manager to be ready."""
-        try:
-            # Try in-cluster config first, fallback to local kubeconfig
-            try:
-                config.load_incluster_config()
-            except config.ConfigException:
-                config.load_kube_config()
-            v1 = client.CoreV1Api()
-            start_time = asyncio.get_event_loop().time()
+        """Wait for cert-manager to be ready.
 
-            while (asyncio.get_event_loop().time() - start_time) < timeout:
-                try:
-                    pods = v1.list_namespaced_pod(
-                        namespace="cert-manager",
-                        label_selector="app.kubernetes.io/name=cert-manager",
-                    )
-
-                    if not pods.items:
-                        await asyncio.sleep(5)
-                        continue
-
-                    all_ready = True
-                    for pod in pods.items:
-                        if not pod.status.container_statuses:
-                            all_ready = False
-                            break
-
-                        for container in pod.status.container_statuses:
-                            if not container.ready:
-                                all_ready = False
-                                break
-
-                    if all_ready:
-                        self.logger.info("cert-manager is ready")
+        The cert-manager pods are watched rather than re-listed on an interval, so
+        readiness is seen as soon as the last container reports ready. The watch
+        blocks, so it runs in the default executor.
+        """
+        v1, _ = self._require_kube_clients()
+
+        ready = await asyncio.get_running_loop().run_in_executor(
+            None,
+            self._watch_cert_manager_ready,
+            v1,
+            timeout,
+        )
+        if ready:
+            self.logger.info("cert-manager is ready")
+            return True
+
+        msg = f"cert-manager not ready after {timeout} seconds"
+        raise TimeoutError(msg)
+
+    def _watch_cert_manager_ready(self, v1: client.CoreV1Api, timeout: float) -> bool:
+        """Block until every cert-manager pod has all containers ready.
+
+        The pods are listed first, so readiness is judged across all of them, and
+        then watched from that listing's resourceVersion. A 410 Gone relists.
+
+        Args:
+            v1: Core API client
+            timeout: Seconds to wait
+
+        Returns:
+            True once all pods are ready, False if the timeout expires first
+        """
+        deadline = time.monotonic() + timeout
+        pods_ready: dict[str, bool] = {}
+        resource_version: str | None = None
+
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                if resource_version is None:
+                    listing = self._list_cert_manager_pods(v1)
+                    pods_ready = {
+                        pod["metadata"]["name"]: self._pod_ready(pod)
+                        for pod in listing.get("items", [])
+                    }
+                    resource_version = listing["metadata"]["resourceVersion"]
+                    if pods_ready and all(pods_ready.values()):
                         return True
 
-                except ApiException as e:
-                    self.logger.warning(f"Error checking cert-manager status: {e}")
+                # Read the raw event stream: events are decoded to plain dicts, with
+                # no V1Pod model hydrated for every pod update
+                response = v1.list_namespaced_pod(
+                    namespace="cert-manager",
+                    label_selector=CERT_MANAGER_POD_SELECTOR,
+                    watch=True,
+                    resource_version=resource_version,
+                    timeout_seconds=max(1, int(remaining)),
+                    _preload_content=False,
+                )
+                try:
+                    for line in iter_resp_lines(response):
+                        if not line:
+                            continue
+
+                        event = _json_loads(line)
+                        pod = event["object"]
+                        if event["type"] == "ERROR":
+                            raise ApiException(status=pod.get("code"), reason=pod.get("reason"))
+
+                        # Resume from here if the stream times out before readiness
+                        resource_version = pod["metadata"]["resourceVersion"]
+                        name = pod["metadata"]["name"]
+                        if event["type"] == "DELETED":
+                            pods_ready.pop(name, None)
+                        else:
+                            pods_ready[name] = self._pod_ready(pod)
+
+                        if pods_ready and all(pods_ready.values()):
+                            return True
+                finally:
+                    response.close()
+                    response.release_conn()
 
-                await asyncio.sleep(5)
+            except ApiException as e:
+                if e.status == HTTPStatus.GONE:
+                    # Our resourceVersion expired; start over from a fresh list
+                    resource_version = None
+                    continue
+                self.logger.warning(f"Error checking cert-manager status: {e}")
+                time.sleep(min(5, max(0, deadline - time.monotonic())))
 
-            msg = f"cert-manager not ready after {timeout} seconds"
-            raise TimeoutError(msg)
+        return False
 
-        except Exception as e:
-            self.logger.exception(f"Failed to check cert-manager readiness: {e}")
-            raise
+    @staticmethod
+    def _list_cert_manager_pods(v1: client.CoreV1Api) -> dict[str, Any]:
+        """List the cert-manager pods and decode the response to plain dicts."""
+        response = v1.list_namespaced_pod(
+            namespace="cert-manager",
+            label_selector=CERT_MANAGER_POD_SELECTOR,
+            _request_timeout=30,
+            _preload_content=False,
+        )
+        try:
+            payload = response.data
+        finally:
+            response.release_conn()
+
+        return _json_loads(payload)
+
+    @staticmethod
+    def _pod_ready(pod: dict[str, Any]) -> bool:
+        """Return whether a pod reports every one of its containers as ready."""
+        container_statuses = pod.get("status", {}).get("containerStatuses")
+        return bool(container_statuses) and all(
+            container.get("ready") for container in container_statuses
+        )
 
+    @handle_cert_errors
     async def _deploy_issuers(self) -> dict[str, Any]:
         """Deploy certificate issuers."""
         self.logger.info("Deploying certificate issuers")
 
-        try:
-            # Apply issuer configuration
-            result = await asyncio.create_subprocess_exec(
-                "kubectl",
-                "apply",
-                "-f",
-                "kubernetes/base/cert-manager-issuers.yaml",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, stderr = await result.communicate()
-
-            if result.returncode != 0:
-                return {
-                    "status": "failed",
-                    "error": "Failed to deploy issuers",
-                    "stderr": stderr.decode(),
-                }
-
-            # Wait for issuers to be ready
-            issuers = ["letsencrypt-prod", "letsencrypt-staging", "selfsigned-issuer", "ca-issuer"]
-            for issuer in issuers:
-                if not await self._wait_for_issuer_ready(issuer):
-                    return {
-                        "status": "failed",
-                        "error": f"Issuer {issuer} failed to become ready",
-                    }
+        # Apply issuer configuration
+        loop = asyncio.get_running_loop()
+        manifest = await loop.run_in_executor(
+            None,
+            partial(ISSUERS_MANIFEST.read_text, encoding="utf-8"),
+        )
 
+        try:
+            await loop.run_in_executor(None, self._apply_manifests, manifest)
+        except (ApiException, ResourceNotFoundError) as e:
             return {
-                "status": "success",
-                "message": "Certificate issuers deployed successfully",
-                "issuers": [
-                    "letsencrypt-prod",
-                    "letsencrypt-staging",
-                    "selfsigned-issuer",
-                    "ca-issuer",
-                ],
+                "status": "failed",
+                "error": f"Failed to deploy issuers: {e}",
             }
 
-        except Exception as e:
-            self.logger.exception(f"Issuer deployment failed: {e}")
+        # One watch stream reports on every issuer
+        issuers = ["letsencrypt-prod", "letsencrypt-staging", "selfsigned-issuer", "ca-issuer"]
+        pending = await self._wait_for_issuers_ready(issuers)
+        if pending:
+            not_ready = ", ".join(issuer for issuer in issuers if issuer in pending)
             return {
                 "status": "failed",
-                "error": str(e),
+                "error": f"Issuers failed to become ready: {not_ready}",
             }
 
+        return {
+            "status": "success",
+            "message": "Certificate issuers deployed successfully",
+            "issuers": issuers,
+        }
+
     @handle_cert_errors
     async def validate_certificates(self) -> dict[str, Any]:
         """Validate all certificates and their endpoints."""
         self.logger.info("Validating certificates")
 
-        from ..core.ui import progress_bar
-
         if not self.http_session:
             return {
                 "status": "failed",
@@ -317,15 +539,37 @@ class CertificateManager:
             }
 
         endpoints = health_checks.get("endpoints", [])
+        http_check = health_checks.get("http_check", False)
+        endpoint_timeout = health_checks.get(
+            "endpoint_timeout",
+            VALIDATION_DEFAULTS["endpoint_timeout"],
+        )
+        # Bounds the sockets and in-flight requests however many endpoints are listed
+        slots = asyncio.Semaphore(
+            health_checks.get("max_concurrency", VALIDATION_DEFAULTS["max_concurrency"]),
+        )
 
         with progress_bar() as progress:
             task = progress.add_task("Validating endpoints...", total=len(endpoints))
 
-            results = []
-            for endpoint in endpoints:
-                progress.update(task, description=f"Validating: {endpoint}...", advance=1)
-                result = await self._validate_endpoint(endpoint)
-                results.append(result)
+            async def validate(endpoint: str) -> dict[str, Any]:
+                async with slots:
+                    try:
+                        result = await asyncio.wait_for(
+                            self._validate_endpoint(endpoint, http_check=http_check),
+                            timeout=endpoint_timeout,
+                        )
+                    except asyncio.TimeoutError:
+                        result = {
+                            "status": "error",
+                            "error": f"Validation timed out after {endpoint_timeout}s",
+                            "ssl_verified": None,
+                        }
+                progress.update(task, description=f"Validated: {endpoint}", advance=1)
+                return result
+
+            # Handshakes overlap, at most max_concurrency at a time
+            results = await asyncio.gather(*(validate(endpoint) for endpoint in endpoints))
 
             endpoint_results = dict(zip(endpoints, results, strict=False))
             successful = sum(
@@ -343,8 +587,22 @@ class CertificateManager:
                 },
             }
 
-    async def _validate_endpoint(self, endpoint: str) -> dict[str, Any]:
-        """Validate a single endpoint's certificate."""
+    async def _validate_endpoint(
+        self,
+        endpoint: str,
+        *,
+        http_check: bool = False,
+    ) -> dict[str, Any]:
+        """Validate a single endpoint's certificate.
+
+        https endpoints are checked with a bare TLS handshake, so the result
+        reflects the certificate rather than the application behind it. With
+        http_check, or for other schemes, the endpoint is fetched instead.
+        """
+        url = urlsplit(endpoint)
+        if url.scheme == "https" and url.hostname and not http_check:
+            return await self._probe_tls(url.hostname, url.port or 443)
+
         try:
             async with self.http_session.get(endpoint) as response:
                 return {
@@ -365,177 +623,314 @@ class CertificateManager:
                 "ssl_verified": None,
             }
 
-    async def check_certificate_expiry(self) -> dict[str, Any]:
-        """Check certificate expiry dates."""
-        self.logger.info("Checking certificate expiry")
+    async def _probe_tls(self, host: str, port: int) -> dict[str, Any]:
+        """Complete a verified TLS handshake with a host and read its certificate.
 
+        No HTTP request is sent, so no response body is downloaded and a slow or
+        failing application does not affect the result.
+        """
         try:
-            # Get all certificates
-            result = await asyncio.create_subprocess_exec(
-                "kubectl",
-                "get",
-                "certificates",
-                "-A",
-                "-o",
-                "json",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port, ssl=_ssl_context(), server_hostname=host),
+                timeout=TLS_PROBE_TIMEOUT,
             )
-            stdout, stderr = await result.communicate()
+        except ssl.SSLError as e:
+            return {
+                "status": "ssl_error",
+                "error": str(e),
+                "ssl_verified": False,
+            }
+        except (OSError, asyncio.TimeoutError) as e:
+            return {
+                "status": "error",
+                "error": str(e) or f"TLS handshake timed out after {TLS_PROBE_TIMEOUT}s",
+                "ssl_verified": None,
+            }
 
-            if result.returncode != 0:
-                return {
-                    "status": "failed",
-                    "error": "Failed to get certificates",
-                    "stderr": stderr.decode(),
-                }
+        peer_cert = writer.get_extra_info("peercert") or {}
+        writer.close()
+        # Let the TLS shutdown finish before the loop can close; a peer resetting
+        # during close_notify does not undo a handshake that already succeeded
+        with contextlib.suppress(OSError, ssl.SSLError):
+            await writer.wait_closed()
 
-            import json
+        return {
+            "status": "success",
+            "ssl_verified": True,
+            "expires": peer_cert.get("notAfter"),
+        }
 
-            certificates_data = json.loads(stdout.decode())
+    async def _get_all_certificates(self) -> list[dict[str, Any]]:
+        """List every Certificate in the cluster, reusing a recent listing.
 
-            expiry_info = []
-            renewal_threshold = self.cert_config.get("validation", {}).get(
-                "renewal_threshold_days",
-                30,
-            )
-            now_utc = datetime.now(timezone.utc)
-            threshold_date = now_utc + timedelta(days=renewal_threshold)
+        The watch-backed index, once populated, always wins. Otherwise back-to-back
+        expiry checks within cache_ttl_seconds share one cluster-wide LIST instead
+        of each issuing their own.
 
-            for cert in certificates_data.get("items", []):
-                cert_name = cert["metadata"]["name"]
-                namespace = cert["metadata"]["namespace"]
+        Returns:
+            Certificate objects as returned by the API
+        """
+        if self._certificate_index is not None:
+            # The watch keeps the index current, so no request is needed
+            with self._certificate_index_lock:
+                return list(self._certificate_index.values())
+
+        ttl = self.cert_config.get("cache_ttl_seconds", CERTIFICATE_CACHE_TTL)
+        if self._certificates_cache is not None:
+            listed_at, items = self._certificates_cache
+            if time.monotonic() - listed_at < ttl:
+                return items
+
+        _, custom_api = self._require_kube_clients()
+        certificates_data = await asyncio.get_running_loop().run_in_executor(
+            None,
+            self._list_certificates,
+            custom_api,
+        )
+        items = certificates_data.get("items", [])
+        self._certificates_cache = (time.monotonic(), items)
+        return items
+
+    @staticmethod
+    def _list_certificates(custom_api: client.CustomObjectsApi) -> dict[str, Any]:
+        """Issue one cluster-wide Certificate LIST and decode the response."""
+        # Take the raw body rather than letting the client json.loads a decoded str
+        response = custom_api.list_cluster_custom_object(
+            "cert-manager.io",
+            "v1",
+            "certificates",
+            _request_timeout=30,
+            _preload_content=False,
+        )
+        try:
+            payload = response.data
+        finally:
+            response.release_conn()
 
-                # Check certificate status
-                status = cert.get("status", {})
-                not_after = status.get("notAfter")
+        return _json_loads(payload)
 
-                if not_after:
-                    try:
-                        expiry_date = dateutil_parser.isoparse(not_after)
-                        # Ensure timezone-aware calculation
-                        if expiry_date.tzinfo is None:
-                            expiry_date = expiry_date.replace(tzinfo=timezone.utc)
-                        days_until_expiry = (expiry_date - now_utc).days
-
-                        cert_info = {
-                            "name": cert_name,
-                            "namespace": namespace,
-                            "expiry_date": not_after,
-                            "days_until_expiry": days_until_expiry,
-                            "needs_renewal": expiry_date < threshold_date,
-                            "status": self._get_certificate_status(cert),
-                        }
-                        expiry_info.append(cert_info)
+    def _start_certificate_watch(self) -> None:
+        """Start the background thread that mirrors cluster Certificates.
 
-                    except (ValueError, TypeError) as e:
-                        self.logger.warning(f"Failed to parse expiry date for {cert_name}: {e}")
+        A daemon thread rather than the default executor, so a watch request
+        still in flight never holds up event loop shutdown.
+        """
+        # A fresh event each time, so a thread left over from an earlier stop()
+        # cannot be revived by this start
+        self._stop_watching = threading.Event()
+        self._certificate_watcher = threading.Thread(
+            target=self._watch_certificates,
+            args=(self._custom_api, self._stop_watching),
+            name="certificate-watch",
+            daemon=True,
+        )
+        self._certificate_watcher.start()
 
-            # Count certificates needing renewal
-            needs_renewal = [cert for cert in expiry_info if cert["needs_renewal"]]
+    def _watch_certificates(
+        self,
+        custom_api: client.CustomObjectsApi,
+        stop_watching: threading.Event,
+    ) -> None:
+        """Keep the certificate index in step with the cluster until stopped.
 
-            return {
-                "status": "success",
-                "certificates": expiry_info,
-                "summary": {
-                    "total": len(expiry_info),
-                    "needs_renewal": len(needs_renewal),
-                    "renewal_threshold_days": renewal_threshold,
-                },
-                "needs_renewal": needs_renewal,
-            }
+        Each cycle lists every Certificate, replaces the index with the result and
+        then applies watch events from that listing's resourceVersion. The watch
+        ends after CERTIFICATE_RESYNC_SECONDS, so a relist regularly reconciles
+        anything the stream missed.
 
-        except Exception as e:
-            self.logger.exception(f"Certificate expiry check failed: {e}")
+        Args:
+            custom_api: Custom objects API client
+            stop_watching: Set by stop() to end the thread
+        """
+        while not stop_watching.is_set():
+            try:
+                listing = self._list_certificates(custom_api)
+                index = {
+                    (cert["metadata"]["namespace"], cert["metadata"]["name"]): cert
+                    for cert in listing.get("items", [])
+                }
+                with self._certificate_index_lock:
+                    if stop_watching.is_set():
+                        break
+                    self._certificate_index = index
+
+                certificate_watch = watch.Watch()
+                for event in certificate_watch.stream(
+                    custom_api.list_cluster_custom_object,
+                    "cert-manager.io",
+                    "v1",
+                    "certificates",
+                    resource_version=listing["metadata"]["resourceVersion"],
+                    timeout_seconds=CERTIFICATE_RESYNC_SECONDS,
+                ):
+                    if stop_watching.is_set():
+                        certificate_watch.stop()
+                        break
+
+                    cert = event["object"]
+                    key = (cert["metadata"]["namespace"], cert["metadata"]["name"])
+                    with self._certificate_index_lock:
+                        if event["type"] == "DELETED":
+                            index.pop(key, None)
+                        else:
+                            index[key] = cert
+
+            except ApiException as e:
+                if e.status == HTTPStatus.GONE:
+                    # Our resourceVersion expired; the next cycle relists
+                    continue
+                self.logger.warning(f"Certificate watch failed: {e.reason}")
+                stop_watching.wait(5)
+
+            except Exception as e:
+                if stop_watching.is_set():
+                    # stop() closed the API client under the in-flight request
+                    break
+                self.logger.warning(f"Certificate watch failed: {e}")
+                stop_watching.wait(5)
+
+    @handle_cert_errors
+    async def check_certificate_expiry(self) -> dict[str, Any]:
+        """Check certificate expiry dates."""
+        self.logger.info("Checking certificate expiry")
+
+        try:
+            certificates = await self._get_all_certificates()
+        except ApiException as e:
             return {
                 "status": "failed",
-                "error": str(e),
+                "error": f"Failed to get certificates: {e.reason}",
             }
 
+        expiry_info = []
+        renewal_threshold = self.cert_config.get("validation", {}).get(
+            "renewal_threshold_days",
+            30,
+        )
+        now_utc = datetime.now(timezone.utc)
+        threshold_date = now_utc + timedelta(days=renewal_threshold)
+
+        previous_cache = self._expiry_cache
+        expiry_cache: dict[tuple[str, str], tuple[str, datetime, str]] = {}
+
+        for cert in certificates:
+            metadata = cert["metadata"]
+            cert_name = metadata["name"]
+            namespace = metadata["namespace"]
+
+            # Check certificate status
+            not_after = cert.get("status", {}).get("notAfter")
+            if not not_after:
+                continue
+
+            key = (namespace, cert_name)
+            resource_version = metadata.get("resourceVersion")
+            cached = previous_cache.get(key)
+            if cached is None or resource_version is None or cached[0] != resource_version:
+                try:
+                    expiry_date = dateutil_parser.isoparse(not_after)
+                    # Ensure timezone-aware calculation
+                    if expiry_date.tzinfo is None:
+                        expiry_date = expiry_date.replace(tzinfo=timezone.utc)
+                    cached = (resource_version, expiry_date, self._get_certificate_status(cert))
+                except (ValueError, TypeError) as e:
+                    self.logger.warning(f"Failed to parse expiry date for {cert_name}: {e}")
+                    continue
+
+            expiry_cache[key] = cached
+            _, expiry_date, cert_status = cached
+            expiry_info.append(
+                {
+                    "name": cert_name,
+                    "namespace": namespace,
+                    "expiry_date": not_after,
+                    "days_until_expiry": (expiry_date - now_utc).days,
+                    "needs_renewal": expiry_date < threshold_date,
+                    "status": cert_status,
+                },
+            )
+
+        # Only certificates present in this listing are carried forward
+        self._expiry_cache = expiry_cache
+
+        # Count certificates needing renewal
+        needs_renewal = [cert for cert in expiry_info if cert["needs_renewal"]]
+
+        return {
+            "status": "success",
+            "certificates": expiry_info,
+            "summary": {
+                "total": len(expiry_info),
+                "needs_renewal": len(needs_renewal),
+                "renewal_threshold_days": renewal_threshold,
+            },
+            "needs_renewal": needs_renewal,
+        }
+
+    @handle_cert_errors
     async def renew_certificate(self, cert_name: str, namespace: str = "default") -> dict[str, Any]:
         """Force renewal of a specific certificate."""
         self.logger.info(f"Renewing certificate: {cert_name} in namespace: {namespace}")
 
+        core_v1, custom_api = self._require_kube_clients()
+        loop = asyncio.get_running_loop()
+
+        # Force certificate renewal by annotating it and deleting its secret. The
+        # patch returns the whole Certificate, so it also yields the secret name
+        # and no separate read is needed
+        annotation = {
+            "metadata": {
+                "annotations": {"cert-manager.io/issue-temporary-certificate": "true"},
+            },
+        }
         try:
-            # Force certificate renewal by deleting the secret
-            annotate_cmd = [
-                "kubectl",
-                "annotate",
-                "certificate",
-                cert_name,
-                "-n",
-                namespace,
-                "cert-manager.io/issue-temporary-certificate=true",
-                "--overwrite",
-            ]
-
-            # First get the secret name safely
-            get_secret_cmd = [
-                "kubectl",
-                "get",
-                "certificate",
-                cert_name,
-                "-n",
-                namespace,
-                "-o",
-                "jsonpath={.spec.secretName}",
-            ]
-
-            # Execute get secret command first
-            result = await asyncio.create_subprocess_exec(
-                *get_secret_cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            certificate = await loop.run_in_executor(
+                None,
+                partial(
+                    custom_api.patch_namespaced_custom_object,
+                    "cert-manager.io",
+                    "v1",
+                    namespace,
+                    "certificates",
+                    cert_name,
+                    annotation,
+                ),
             )
-            stdout, stderr = await result.communicate()
+        except ApiException as e:
+            return {
+                "status": "failed",
+                "error": f"Failed to annotate certificate: {e.reason}",
+            }
 
-            if result.returncode != 0:
-                return {
-                    "status": "failed",
-                    "error": f"Failed to get certificate secret name: {stderr.decode()}",
-                }
+        secret_name = certificate.get("spec", {}).get("secretName")
+        if not secret_name:
+            return {
+                "status": "failed",
+                "error": "Certificate secret name is empty",
+            }
 
-            secret_name = stdout.decode().strip()
-            if not secret_name:
+        try:
+            await loop.run_in_executor(
+                None,
+                core_v1.delete_namespaced_secret,
+                secret_name,
+                namespace,
+            )
+        except ApiException as e:
+            # An already missing secret is just as good for renewal
+            if e.status != HTTPStatus.NOT_FOUND:
                 return {
                     "status": "failed",
-                    "error": "Certificate secret name is empty",
+                    "error": f"Failed to renew certificate: {e.reason}",
                 }
 
-            delete_secret_cmd = [
-                "kubectl",
-                "delete",
-                "secret",
-                secret_name,
-                "-n",
-                namespace,
-            ]
+        # The listing no longer reflects this certificate's state
+        self._certificates_cache = None
 
-            for cmd in [annotate_cmd, delete_secret_cmd]:
-                result = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                stdout, stderr = await result.communicate()
-
-                if result.returncode != 0 and "not found" not in stderr.decode().lower():
-                    return {
-                        "status": "failed",
-                        "error": f"Failed to renew certificate: {stderr.decode()}",
-                    }
-
-            return {
-                "status": "success",
-                "message": f"Certificate renewal initiated for {cert_name}",
-            }
-
-        except Exception as e:
-            self.logger.exception(f"Certificate renewal failed: {e}")
-            return {
-                "status": "failed",
-                "error": str(e),
-            }
+        return {
+            "status": "success",
+            "message": f"Certificate renewal initiated for {cert_name}",
+        }
 
     def _get_certificate_status(self, cert: dict[str, Any]) -> str:
         conditions = cert.get("status", {}).get("conditions", [])
@@ -543,10 +938,11 @@ class CertificateManager:
         ready_conditions = [cond for cond in conditions if cond.get("type") == "Ready"]
         # Get most recent Ready condition
         if ready_conditions:
-            latest_ready = max(
-                ready_conditions,
-                key=lambda x: dateutil_parser.isoparse(x.get("lastTransitionTime", "")),
-            )
+            transitions = [
+                (_parse_timestamp(cond.get("lastTransitionTime", "")), cond)
+                for cond in ready_conditions
+            ]
+            _, latest_ready = max(transitions, key=lambda pair: pair[0])
             return "ready" if latest_ready.get("status") == "True" else "not_ready"
         return "unknown"
 
@@ -559,22 +955,20 @@ class CertificateManager:
         issuers = self.cert_config.get("issuers", {})
         return [name for name, config in issuers.items() if config.get("enabled", False)]
 
-    async def _wait_for_issuer_ready(self, issuer_name: str, namespace: str = "default") -> bool:
-        """Wait for a certificate issuer to be ready.
+    async def _wait_for_issuers_ready(self, issuer_names: Iterable[str]) -> set[str]:
+        """Wait for cluster issuers to be ready.
+
+        The issuers are watched rather than fetched on an interval, so each Ready
+        condition is seen as soon as cert-manager sets it.
 
         Args:
-            issuer_name: Name of the issuer to check
-            namespace: Kubernetes namespace where the issuer is deployed
+            issuer_names: Names of the ClusterIssuers to wait for
 
         Returns:
-            bool: True if issuer becomes ready within timeout, False otherwise
+            Names of the issuers still not ready when the timeout expired; empty
+            once all of them are ready
         """
-        # Try in-cluster config first, fallback to local kubeconfig
-        try:
-            config.load_incluster_config()
-        except config.ConfigException:
-            config.load_kube_config()
-        custom_api = client.CustomObjectsApi()
+        _, custom_api = self._require_kube_clients()
         timeout = self.cert_config.get(
             "issuer_readiness_timeout",
             ISSUER_DEFAULTS["readiness_timeout"],
@@ -584,22 +978,77 @@ class CertificateManager:
             ISSUER_DEFAULTS["polling_interval"],
         )
 
-        start_time = asyncio.get_event_loop().time()
-        while (asyncio.get_event_loop().time() - start_time) < timeout:
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            self._watch_issuers_ready,
+            custom_api,
+            set(issuer_names),
+            timeout,
+            interval,
+        )
+
+    def _watch_issuers_ready(
+        self,
+        custom_api: client.CustomObjectsApi,
+        pending: set[str],
+        timeout: float,
+        retry_interval: float,
+    ) -> set[str]:
+        """Block until every pending issuer reports a Ready=True condition.
+
+        Args:
+            custom_api: Custom objects API client
+            pending: Names of the ClusterIssuers still to become ready
+            timeout: Seconds to wait
+            retry_interval: Seconds to pause before re-watching after an API error
+
+        Returns:
+            Names of the issuers not ready when the timeout expired
+        """
+        deadline = time.monotonic() + timeout
+        resource_version: str | None = None
+
+        while (remaining := deadline - time.monotonic()) > 0:
+            issuer_watch = watch.Watch()
+            # Resume where the previous stream ended instead of listing again
+            resume = {"resource_version": resource_version} if resource_version else {}
             try:
-                issuer = custom_api.get_namespaced_custom_object(
+                for event in issuer_watch.stream(
+                    custom_api.list_cluster_custom_object,
                     group="cert-manager.io",
                     version="v1",
-                    namespace=namespace,
-                    plural="issuers",
-                    name=issuer_name,
-                )
-                if any(
-                    cond.get("type") == "Ready" and cond.get("status") == "True"
-                    for cond in issuer.get("status", {}).get("conditions", [])
+                    plural="clusterissuers",
+                    timeout_seconds=max(1, int(remaining)),
+                    **resume,
                 ):
-                    return True
+                    issuer = event["object"]
+                    name = issuer["metadata"]["name"]
+                    if (
+                        name in pending
+                        and event["type"] != "DELETED"
+                        and self._issuer_ready(issuer)
+                    ):
+                        pending.discard(name)
+                        if not pending:
+                            issuer_watch.stop()
+                            return pending
+
+                resource_version = issuer_watch.resource_version
+
             except ApiException as e:
+                if e.status == HTTPStatus.GONE:
+                    # Our resourceVersion expired; start over from a fresh list
+                    resource_version = None
+                    continue
                 self.logger.warning(f"Error checking issuer status: {e}")
-            await asyncio.sleep(interval)
-        return False
+                time.sleep(min(retry_interval, max(0, deadline - time.monotonic())))
+
+        return pending
+
+    @staticmethod
+    def _issuer_ready(issuer: dict[str, Any]) -> bool:
+        """Return whether an issuer object carries a Ready=True condition."""
+        return any(
+            cond.get("type") == "Ready" and cond.get("status") == "True"
+            for cond in issuer.get("status", {}).get("conditions", [])
+        )
@@ -5,6 +5,7 @@ Integrates with the consolidated config system and provides runtime configuratio
 management with environment-specific overrides, validation, and caching.
 """
 
+import copy
 import logging
 import os
 from dataclasses import dataclass, field
@@ -14,6 +15,34 @@ from typing import Any
 import yaml
 
 
+# Parsed configuration files keyed by path, reused while (mtime_ns, size) is unchanged
+_PARSED_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], Any]] = {}
+
+
+def _load_yaml_file(path: Path) -> Any:
+    """Parse a YAML file, reusing the previous parse while the file is unchanged.
+
+    Args:
+        path: YAML file to load
+
+    Returns:
+        A private deep copy of the parsed data, since ConfigManager getters apply
+        environment overrides in place
+    """
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _PARSED_CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        data = cached[1]
+    else:
+        with open(path) as f:
+            data = yaml.safe_load(f)
+        _PARSED_CONFIG_CACHE[path] = (signature, data)
+
+    return copy.deepcopy(data)
+
+
 @dataclass
 class ConfigContext:
     """Configuration context for environment and deployment settings."""
@@ -92,10 +121,9 @@ class ConfigManager:
             config_path = self.consolidated_config_dir / config_file
             if config_path.exists():
                 try:
-                    with open(config_path) as f:
-                        config_name = config_file.replace(".yaml", "")
-                        self._config_cache[config_name] = yaml.safe_load(f)
-                        self.logger.debug(f"Loaded {config_name} configuration")
+                    config_name = config_file.replace(".yaml", "")
+                    self._config_cache[config_name] = _load_yaml_file(config_path)
+                    self.logger.debug(f"Loaded {config_name} configuration")
                 except Exception as e:
                     self.logger.exception(f"Failed to load {config_file}: {e}")
             else:
@@ -3,64 +3,135 @@ Decorator utilities for the homelab orchestrator.
 
 This module provides decorators used throughout the homelab orchestrator
 to handle common patterns like orchestrator lifecycle management and
-context propagation.
+context propagation, plus the shared event loop CLI commands run on.
 """
 
+from __future__ import annotations
+
 import asyncio
-from collections.abc import Callable
+import inspect
 from functools import wraps
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
 
-from click import Context
-from rich.console import Console
+    from click import Context
 
-from .config_manager import ConfigManager
-from .orchestrator import HomelabOrchestrator
+    from .orchestrator import HomelabOrchestrator
 
 
-console = Console()
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    uvloop = None
+
 
 T = TypeVar("T")
 
+# Holds the shared loop under "loop", so it can be swapped without a global statement
+_shared: dict[str, asyncio.AbstractEventLoop] = {}
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on the CLI's shared event loop.
+
+    The loop (uvloop-backed when available) is created on first use and reused by
+    every later call in the same process, instead of building and tearing down a
+    fresh loop per ``asyncio.run``. Call :func:`close_event_loop` when done.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    loop = _shared.get("loop")
+    if loop is None or loop.is_closed():
+        loop = _shared["loop"] = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop.run_until_complete(coro)
+
+
+def close_event_loop() -> None:
+    """Cancel leftover tasks and close the shared event loop, if one was created."""
+    loop = _shared.pop("loop", None)
+    if loop is None or loop.is_closed():
+        return
+
+    try:
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def get_orchestrator(ctx: Context) -> HomelabOrchestrator:
+    """Return the orchestrator shared by the current CLI invocation.
+
+    The first call builds it from the ``orch_kwargs`` that ``cli()`` stores on the
+    root context, starts it on the shared event loop and registers its
+    shutdown on the root context, so every command in the invocation reuses one
+    started instance. Shutdown runs before the event loop itself is closed.
+
+    Args:
+        ctx: Click context of the running command
+
+    Returns:
+        Started HomelabOrchestrator instance
+    """
+    root = ctx.find_root()
+    orchestrator = root.obj.get("orchestrator")
+    if orchestrator is not None:
+        return orchestrator
+
+    # Deferred so CLI startup (--help, --version, config commands) never loads
+    # the orchestrator's dependency graph
+    from .orchestrator import HomelabOrchestrator
+
+    orchestrator = HomelabOrchestrator(**root.obj["orch_kwargs"])
+    run_async(orchestrator.start())
+
+    root.obj["orchestrator"] = orchestrator
+    root.call_on_close(lambda: run_async(orchestrator.stop()))
+    return orchestrator
+
 
 def with_orchestrator(f: Callable[..., T]) -> Callable[..., T]:
     """Decorator to handle orchestrator setup and teardown.
 
     This decorator manages the lifecycle of a HomelabOrchestrator instance for CLI commands.
     It ensures the orchestrator is properly initialized with the correct configuration and
-    safely shut down after command execution.
+    safely shut down once the CLI invocation finishes.
 
     Args:
         f: The function to be decorated. Should accept a click.Context as first argument
-           and a HomelabOrchestrator as a keyword argument.
+           and a HomelabOrchestrator as a keyword argument. Coroutine functions are
+           run to completion on the shared event loop.
 
     Returns:
         A wrapped function that handles orchestrator lifecycle management.
 
     The wrapped function will:
-    1. Extract configuration from the click.Context object
-    2. Initialize the orchestrator with proper configuration
-    3. Start the orchestrator
-    4. Execute the decorated function
-    5. Ensure the orchestrator is stopped properly
+    1. Fetch the invocation's shared orchestrator via :func:`get_orchestrator`,
+       building and starting it on first use
+    2. Execute the decorated function on the shared event loop, awaiting it
+       directly when it is a coroutine function
+    3. Leave shutdown to the root context, which stops the orchestrator when the
+       invocation closes
     """
+    is_coroutine = inspect.iscoroutinefunction(f)
 
     @wraps(f)
     def wrapper(ctx: Context, *args: Any, **kwargs: Any) -> T:
-        async def run() -> T:
-            config_manager = ctx.obj.get("config_manager")
-            if not config_manager:
-                config_manager = ConfigManager(
-                    project_root=ctx.obj.get("project_root"),
-                    environment=ctx.obj.get("environment"),
-                )
-            orchestrator = HomelabOrchestrator(config_manager=config_manager)
-            try:
-                await orchestrator.start()
-                return await f(ctx, *args, orchestrator=orchestrator, **kwargs)
-            finally:
-                await orchestrator.stop()
-
-        return asyncio.run(run())
+        result = f(ctx, *args, orchestrator=get_orchestrator(ctx), **kwargs)
+        return run_async(result) if is_coroutine else result
 
     return wrapper
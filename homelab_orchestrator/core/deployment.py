@@ -31,7 +31,7 @@ class DeploymentHook:
     environment: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class DeploymentResult:
     """Result of a deployment operation."""
 
@@ -44,7 +44,7 @@ class OrchestrationEvent:
     correlation_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OrchestrationResult:
     """Result of orchestration operation."""
 
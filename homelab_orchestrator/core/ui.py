@@ -1,25 +1,83 @@
 """UI utilities for consistent CLI interface."""
 
-from collections.abc import Iterator
+from __future__ import annotations
+
+import dataclasses
+import json
+import sys
 from contextlib import contextmanager
+from datetime import date, datetime, time
+from enum import Enum
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Any
+
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
 
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+    from rich.console import Console, RenderableType
+    from rich.progress import Progress
+    from rich.table import Table
 
 
-console = Console()
+# Result status -> Rich color, shared by every report instead of rebuilt per call
+_STATUS_COLORS = {
+    "success": "green",
+    "failure": "red",
+    "warning": "yellow",
+    "partial": "yellow",
+}
+
+
+@cache
+def get_console() -> Console:
+    """Return the shared Rich console, importing Rich on first use.
+
+    Returns:
+        Process-wide Console instance
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+class NullProgress:
+    """Progress stand-in for non-interactive output; tasks are accepted and ignored."""
+
+    def add_task(self, description: str, *args: Any, **kwargs: Any) -> int:
+        """Accept a task without rendering it."""
+        return 0
+
+    def update(self, task_id: int, *args: Any, **kwargs: Any) -> None:
+        """Ignore task updates."""
 
 
 @contextmanager
-def progress_bar(*, transient: bool = True) -> Iterator[Progress]:
+def progress_bar(*, transient: bool = True) -> Iterator[Progress | NullProgress]:
     """Create a standardized progress bar with spinner and elapsed time.
 
+    When the console is not a terminal (CI, pipes, log files) a NullProgress is
+    yielded instead, so no refresh thread runs and no ANSI codes are written.
+
     Args:
         transient: Whether the progress bar should be cleared after completion
 
     Returns:
         Progress context manager for use in with statement
     """
+    console = get_console()
+    if not console.is_terminal:
+        yield NullProgress()
+        return
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -28,3 +86,190 @@ def progress_bar(*, transient: bool = True) -> Iterator[Progress]:
         console=console,
     ) as progress:
         yield progress
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert a value neither JSON encoder handles natively.
+
+    orjson encodes datetimes, dataclasses and enums itself, so with it this only
+    runs for leftovers such as Path; the stdlib fallback relies on it to produce
+    the same output orjson would.
+    """
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+
+def emit_json(data: Any) -> None:
+    """Write data to stdout as indented JSON, bypassing Rich rendering.
+
+    Args:
+        data: JSON-serializable data; datetimes become ISO 8601 strings, enums
+            their values, dataclasses objects, sets lists and anything else str()
+    """
+    if orjson is None:
+        # json.dump feeds the encoder's chunks straight to the stream, so the
+        # document is never held as one string
+        json.dump(data, sys.stdout, indent=2, default=_json_default)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+        return
+
+    payload = orjson.dumps(
+        data,
+        default=_json_default,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    )
+    sys.stdout.flush()
+    # Two writes rather than payload + b"\n", which would copy the whole document
+    sys.stdout.buffer.write(payload)
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
+
+
+@lru_cache(maxsize=16)
+def status_markup(status: str) -> str:
+    """Return the colored, upper-cased Rich markup for a result status."""
+    color = _STATUS_COLORS.get(status, "white")
+    return f"[{color}]{status.upper()}[/{color}]"
+
+
+def make_table(
+    title: str,
+    columns: Sequence[tuple[str, str | None]],
+    rows: Iterable[Sequence[RenderableType]],
+    *,
+    column_options: Mapping[str, Mapping[str, Any]] | None = None,
+) -> Table:
+    """Build a Rich table from (header, style) column specs and pre-rendered rows.
+
+    Args:
+        title: Table title
+        columns: Column header and style pairs, in display order
+        rows: Row cell values: markup strings or renderables such as styled Text;
+            raw data goes in Text cells so brackets in it are not read as markup
+        column_options: Extra add_column() arguments keyed by header, e.g. a fixed
+            width and no_wrap for columns whose content size is known up front
+
+    Returns:
+        Populated table ready to print
+    """
+    from rich.table import Table
+
+    column_options = column_options or {}
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style, **column_options.get(header, {}))
+
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
+
+    return table
+
+
+def _plain(cell: Any) -> str:
+    """Return the text of a markup string or Rich Text cell without styling.
+
+    Strings are parsed as Rich markup, exactly as the console would render them,
+    so only markup built by the CLI itself should be passed as a str.
+    """
+    if isinstance(cell, str):
+        from rich.text import Text
+
+        return Text.from_markup(cell).plain
+    return getattr(cell, "plain", None) or str(cell)
+
+
+class RichReport:
+    """Report writer that renders panels, tables and lines on the shared console."""
+
+    def __init__(self, console: Console) -> None:
+        """Initialize the report.
+
+        Args:
+            console: Console to render on
+        """
+        self.console = console
+
+    def panel(self, body: str, *, title: str) -> None:
+        """Render markup text inside a titled panel."""
+        from rich.panel import Panel
+
+        self.console.print(Panel(body, title=title))
+
+    def table(
+        self,
+        title: str,
+        columns: Sequence[tuple[str, str | None]],
+        rows: Iterable[Sequence[RenderableType]],
+        *,
+        column_options: Mapping[str, Mapping[str, Any]] | None = None,
+    ) -> None:
+        """Render a table; see make_table for the arguments."""
+        self.console.print(make_table(title, columns, rows, column_options=column_options))
+
+    def line(self, text: str = "") -> None:
+        """Render one line of markup text."""
+        self.console.print(text)
+
+
+class PlainReport:
+    """Report writer for non-interactive output: plain lines, tab-separated rows."""
+
+    def __init__(self) -> None:
+        """Initialize the report with an empty output buffer."""
+        self.lines: list[str] = []
+
+    def panel(self, body: str, *, title: str) -> None:
+        """Write the title followed by the body text."""
+        self.lines.append(title)
+        self.lines.append(_plain(body))
+        self.lines.append("")
+
+    def table(
+        self,
+        title: str,
+        columns: Sequence[tuple[str, str | None]],
+        rows: Iterable[Sequence[RenderableType]],
+        *,
+        column_options: Mapping[str, Mapping[str, Any]] | None = None,
+    ) -> None:
+        """Write the title, a header row and one tab-separated line per row."""
+        lines = self.lines
+        lines.append(title)
+        lines.append("\t".join(header for header, _ in columns))
+        lines.extend("\t".join(_plain(cell) for cell in row) for row in rows)
+        lines.append("")
+
+    def line(self, text: str = "") -> None:
+        """Write one line of text with markup removed."""
+        self.lines.append(_plain(text))
+
+
+@contextmanager
+def report() -> Iterator[RichReport | PlainReport]:
+    """Collect a command's report and write it to stdout in one go.
+
+    On a terminal the report is rendered by Rich with the console's output
+    buffered. Otherwise (CI, pipes, log files) a PlainReport is yielded instead,
+    so no panel, table or markup is rendered at all.
+
+    Returns:
+        Report writer context manager for use in with statement
+    """
+    console = get_console()
+    if not console.is_terminal:
+        plain = PlainReport()
+        yield plain
+        sys.stdout.write("\n".join(plain.lines).rstrip("\n") + "\n")
+        return
+
+    with console:
+        yield RichReport(console)
@@ -0,0 +1,59 @@
+import click
+import pytest
+from click.testing import CliRunner
+
+from homelab_orchestrator.cli import LazyGroup, cli
+
+
+LAZY_GROUPS = (
+    "certificates",
+    "config",
+    "deploy",
+    "gpu",
+    "health",
+    "manage",
+    "status",
+    "webhook",
+)
+
+
+def test_help_lists_lazy_groups():
+    """Test that root help lists every lazily loaded group."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--help"])
+    assert result.exit_code == 0
+    commands = result.output.split("Commands:", 1)[1]
+    for name in LAZY_GROUPS:
+        assert f"  {name} " in commands
+
+
+def test_lazy_command_resolves_once():
+    """Test that resolving a lazy command twice returns the same object."""
+    ctx = click.Context(cli)
+    first = cli.get_command(ctx, "config")
+    assert isinstance(first, click.Group)
+    assert cli.get_command(ctx, "config") is first
+    assert "config" not in cli.lazy_subcommands
+
+
+def test_lazy_command_invokes():
+    """Test that a lazy group dispatches to its subcommands."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["gpu", "--help"])
+    assert result.exit_code == 0
+    assert "discover" in result.output
+    assert "status" in result.output
+
+
+def test_lazy_command_rejects_non_command():
+    """Test that an import path naming a non-command raises TypeError."""
+    group = LazyGroup(lazy_subcommands={"bad": "homelab_orchestrator.cli:setup_logging"})
+    with pytest.raises(TypeError, match="not a Click command"):
+        group.get_command(click.Context(group), "bad")
+
+
+def test_lazy_command_error_through_runner():
+    """Test that the TypeError surfaces when the bad command is invoked."""
+    group = LazyGroup(lazy_subcommands={"bad": "homelab_orchestrator.cli:setup_logging"})
+    result = CliRunner().invoke(group, ["bad"])
+    assert isinstance(result.exception, TypeError)
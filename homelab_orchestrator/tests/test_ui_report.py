@@ -0,0 +1,42 @@
+from rich.console import Console
+
+from homelab_orchestrator.cli_certs import _endpoint_validation_row
+from homelab_orchestrator.core.ui import PlainReport, RichReport
+
+
+ENDPOINT = "https://[fe80::1]:443"
+ERROR = "[nodename nor servname provided, or not known]"
+
+COLUMNS = (("Endpoint", "cyan"), ("Status", "bold"), ("SSL Verified", "green"), ("Details", None))
+
+
+def endpoint_row():
+    return _endpoint_validation_row(
+        ENDPOINT,
+        {"status": "error", "error": ERROR, "ssl_verified": None},
+    )
+
+
+def test_plain_report_keeps_bracketed_data():
+    """Test that plain output keeps IPv6 endpoints and bracketed error text intact."""
+    out = PlainReport()
+    out.table("Certificate Validation Results", COLUMNS, [endpoint_row()])
+    assert out.lines[2] == f"{ENDPOINT}\tERROR\t❌\t{ERROR}"
+
+
+def test_plain_report_strips_markup():
+    """Test that markup built by the CLI is removed from plain output."""
+    out = PlainReport()
+    out.table("Status", (("Component", None), ("Status", None)), [("API", "[green]UP[/green]")])
+    out.line("[yellow]Recommendations:[/yellow]")
+    assert out.lines[2] == "API\tUP"
+    assert out.lines[-1] == "Recommendations:"
+
+
+def test_rich_report_keeps_bracketed_data():
+    """Test that the terminal table renders bracketed data cells verbatim."""
+    console = Console(record=True, width=200)
+    RichReport(console).table("Certificate Validation Results", COLUMNS, [endpoint_row()])
+    rendered = console.export_text()
+    assert ENDPOINT in rendered
+    assert ERROR in rendered
@@ -0,0 +1,272 @@
+"""Tests for the GitHub webhook service: signatures, push handling and notifications."""
+
+import hashlib
+import hmac
+import importlib.util
+import json
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+from flask import Flask, request
+
+
+WEBHOOK_PATH = Path(__file__).parents[2] / "deployments/gitops/webhooks/github-webhook.py"
+
+BODY = b'{"zen": "Keep it logically awesome.",\n"hook_id": 1}\n{"trailing": "line"}\n'
+
+
+@pytest.fixture(scope="module")
+def webhook():
+    """Load github-webhook.py, whose file name is not importable as a module."""
+    spec = importlib.util.spec_from_file_location("github_webhook", WEBHOOK_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture()
+def client(webhook):
+    """Flask test client for the webhook app."""
+    return webhook.app.test_client()
+
+
+def sign(webhook, body):
+    """Return the X-Hub-Signature-256 header value GitHub would send for body."""
+    digest = hmac.new(webhook.WEBHOOK_SECRET.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+def post(client, body, signature):
+    """POST a ping delivery to the GitHub webhook endpoint."""
+    return client.post(
+        "/webhook/github",
+        data=body,
+        content_type="application/json",
+        headers={"X-GitHub-Event": "ping", "X-Hub-Signature-256": signature},
+    )
+
+
+def test_valid_signature_accepted(webhook, client):
+    """Test that a correctly signed delivery is processed."""
+    body = b'{"zen": "Keep it logically awesome."}'
+    response = post(client, body, sign(webhook, body))
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "ignored"
+
+
+def test_tampered_body_rejected(webhook, client):
+    """Test that a body changed after signing is rejected."""
+    body = b'{"zen": "Keep it logically awesome."}'
+    response = post(client, body + b" ", sign(webhook, body))
+    assert response.status_code == 401
+
+
+@pytest.mark.parametrize(
+    "signature",
+    [
+        None,
+        "sha1=0000",
+        "sha256=not-hex",
+        "sha256=" + "0" * 64,
+    ],
+)
+def test_bad_signature_rejected(webhook, client, signature):
+    """Test that missing, unsupported, malformed and wrong signatures are rejected."""
+    body = b'{"zen": "Keep it logically awesome."}'
+    headers = {"X-GitHub-Event": "ping"}
+    if signature is not None:
+        headers["X-Hub-Signature-256"] = signature
+    response = client.post(
+        "/webhook/github",
+        data=body,
+        content_type="application/json",
+        headers=headers,
+    )
+    assert response.status_code == 401
+
+
+@pytest.mark.parametrize("mode", ["read", "readline", "readlines", "iter"])
+def test_stream_hashes_body_however_read(webhook, mode):
+    """Test that every way of reading wsgi.input yields the digest of the whole body."""
+    app = Flask(__name__)
+
+    @app.route("/webhook/github", methods=["POST"])
+    def echo_digest():
+        stream = request.environ["wsgi.input"]
+        if mode == "read":
+            data = stream.read()
+        elif mode == "readline":
+            data = b"".join(iter(stream.readline, b""))
+        elif mode == "readlines":
+            data = b"".join(stream.readlines())
+        else:
+            data = b"".join(stream)
+        assert data == BODY
+        return request.environ["homelab.hmac"].hexdigest()
+
+    app.wsgi_app = webhook.HMACInputMiddleware(app.wsgi_app, paths=("/webhook/github",))
+    response = app.test_client().post("/webhook/github", data=BODY)
+
+    assert response.status_code == 200
+    assert f"sha256={response.get_data(as_text=True)}" == sign(webhook, BODY)
+
+
+def test_other_paths_not_hashed(webhook):
+    """Test that the middleware leaves requests to other paths untouched."""
+    app = Flask(__name__)
+
+    @app.route("/webhook/health", methods=["POST"])
+    def has_mac():
+        return str("homelab.hmac" in request.environ)
+
+    app.wsgi_app = webhook.HMACInputMiddleware(app.wsgi_app, paths=("/webhook/github",))
+    response = app.test_client().post("/webhook/health", data=BODY)
+
+    assert response.get_data(as_text=True) == "False"
+
+
+REPOSITORY_URL = "https://github.com/tzervas/homelab-infra.git"
+
+
+@pytest.fixture()
+def sync_calls(webhook, monkeypatch):
+    """Record ArgoCD syncs instead of sending them, starting from empty caches."""
+    calls = []
+
+    def trigger_argocd_sync(application_name, repository_url, branch="main"):
+        calls.append((application_name, repository_url, branch))
+        return {"status": "success"}
+
+    monkeypatch.setattr(webhook, "trigger_argocd_sync", trigger_argocd_sync)
+    monkeypatch.setattr(webhook, "_recent_deliveries", OrderedDict())
+    return calls
+
+
+def push_payload(ref="refs/heads/main", commits=None, **extra):
+    """Build a push event payload that modifies the monitoring applications."""
+    if commits is None:
+        commits = [{"modified": ["deployments/gitops/applications/monitoring.yaml"]}]
+    return {"ref": ref, "commits": commits, "repository": {"clone_url": REPOSITORY_URL}, **extra}
+
+
+def post_push(webhook, client, payload, delivery_id=None):
+    """POST a signed push event, optionally tagged with an X-GitHub-Delivery id."""
+    body = json.dumps(payload).encode()
+    headers = {"X-GitHub-Event": "push", "X-Hub-Signature-256": sign(webhook, body)}
+    if delivery_id:
+        headers["X-GitHub-Delivery"] = delivery_id
+    return client.post(
+        "/webhook/github",
+        data=body,
+        content_type="application/json",
+        headers=headers,
+    )
+
+
+def test_affected_applications_sorted_path_order(webhook, sync_calls):
+    """Test that changed files map to applications in sorted-path order, deduplicated."""
+    changed_files = [
+        "kubernetes/base/ingress.yaml",
+        "README.md",
+        "helm/values.yaml",
+        "deployments/gitops/applications/monitoring.yaml",
+    ]
+    expected = ["prometheus-stack", "loki-stack", "homelab-apps"]
+    assert webhook.get_affected_applications(REPOSITORY_URL, changed_files) == expected
+    assert webhook.get_affected_applications(REPOSITORY_URL, changed_files[::-1]) == expected
+    assert webhook.get_affected_applications(REPOSITORY_URL, ["docs/index.md"]) == []
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        push_payload(ref="refs/heads/feature/x"),
+        push_payload(ref="refs/tags/v1.0.0"),
+        push_payload(deleted=True),
+        push_payload(commits=[]),
+    ],
+    ids=["non-deploy-branch", "tag", "deletion", "no-commits"],
+)
+def test_push_ignored(webhook, client, sync_calls, payload):
+    """Test that pushes which cannot trigger a deployment sync nothing."""
+    response = post_push(webhook, client, payload)
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "ignored"
+    assert sync_calls == []
+
+
+def test_push_syncs_affected_applications(webhook, client, sync_calls):
+    """Test that a push syncs each affected application and reports compact results."""
+    response = post_push(webhook, client, push_payload())
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["affected_applications"] == ["prometheus-stack", "loki-stack"]
+    assert body["sync_results"] == [["prometheus-stack", "success"], ["loki-stack", "success"]]
+    assert sorted(sync_calls) == [
+        ("loki-stack", REPOSITORY_URL, "main"),
+        ("prometheus-stack", REPOSITORY_URL, "main"),
+    ]
+
+
+def test_push_affecting_nothing_syncs_nothing(webhook, client, sync_calls):
+    """Test that a push touching no mapped path succeeds without syncing."""
+    payload = push_payload(commits=[{"added": ["docs/index.md"]}])
+    response = post_push(webhook, client, payload)
+    assert response.get_json()["status"] == "success"
+    assert sync_calls == []
+
+
+def test_redelivery_short_circuits(webhook, client, sync_calls):
+    """Test that a replayed X-GitHub-Delivery returns the stored result without syncing."""
+    first = post_push(webhook, client, push_payload(), delivery_id="delivery-1")
+    replay = post_push(webhook, client, push_payload(), delivery_id="delivery-1")
+    assert replay.get_json() == first.get_json()
+    assert len(sync_calls) == 2
+
+    post_push(webhook, client, push_payload(), delivery_id="delivery-2")
+    assert len(sync_calls) == 4
+
+
+def test_failed_delivery_not_cached(webhook, client, sync_calls, monkeypatch):
+    """Test that a delivery with a failed sync is synced again when redelivered."""
+
+    def trigger_argocd_sync(application_name, repository_url, branch="main"):
+        sync_calls.append(application_name)
+        return {"status": "failed"}
+
+    monkeypatch.setattr(webhook, "trigger_argocd_sync", trigger_argocd_sync)
+    post_push(webhook, client, push_payload(), delivery_id="delivery-1")
+    post_push(webhook, client, push_payload(), delivery_id="delivery-1")
+    assert webhook.get_cached_delivery("delivery-1") is None
+    assert len(sync_calls) == 4
+
+
+def test_notification_fields_from_query_string(webhook):
+    """Test that fields all present in the query string skip the JSON body."""
+    with webhook.app.test_request_context(
+        "/webhook/health?application=grafana&health=Degraded",
+        method="POST",
+        data=b"not json",
+        content_type="application/json",
+    ):
+        fields = webhook.get_notification_fields("application", "health")
+    assert fields == {"application": "grafana", "health": "Degraded"}
+
+
+def test_notification_fields_fall_back_to_json(webhook):
+    """Test that missing query fields are read from the JSON body, query taking precedence."""
+    with webhook.app.test_request_context(
+        "/webhook/health?application=grafana",
+        method="POST",
+        json={"application": "loki", "health": "Missing"},
+    ):
+        fields = webhook.get_notification_fields("application", "health")
+    assert fields == {"application": "grafana", "health": "Missing"}
+
+
+def test_notification_without_fields_rejected(client):
+    """Test that a notification with neither query fields nor a JSON body gets 400."""
+    response = client.post("/webhook/drift", json={})
+    assert response.status_code == 400
+    assert client.post("/webhook/drift?application=grafana").status_code == 200